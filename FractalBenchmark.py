@@ -0,0 +1,246 @@
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tracemalloc
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+
+# Benchmarks every fractal engine over a fixed matrix of resolutions,
+# iteration caps and viewports, writes the results as JSON and compares them
+# against a stored baseline:
+#
+#   python FractalBenchmark.py --save-baseline      # record this machine's baseline
+#   python FractalBenchmark.py                      # fails if anything regressed
+#
+# Throughput is megapixel-iterations per second (pixels x iteration cap) for
+# the escape-time engines and megapixels per second for coloring. Peak memory
+# is the growth of the process high-water mark while the case runs; every
+# case runs in a fresh process so one case's peak can't hide the next one's.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(HERE, "fractal_benchmark_baseline.json")
+
+RESOLUTIONS = [(320, 240), (800, 600), (1920, 1080)]
+ITERATIONS = [100, 1000]
+# (x_center, y_center, view width) per fractal type
+VIEWPORTS = {
+    "mandelbrot": {"full": (-0.5, 0.0, 3.0), "seahorse": (-0.745, 0.1, 0.01)},
+    "julia": {"full": (0.0, 0.0, 3.0), "detail": (0.3, 0.2, 0.05)},
+}
+JULIA_C = complex(-0.7, 0.27015)
+COLOR_MODES = ["linear", "histogram", "cdf"]
+# The per-pixel Python engines only run the smallest case
+PYTHON_RESOLUTIONS = [(160, 120)]
+PYTHON_ITERATIONS = [100]
+
+def studio():
+    sys.path.insert(0, HERE)
+    import GenerateArtStudio
+    return GenerateArtStudio
+
+def numba_fractals():
+    # GenerativeArtStudio/fractals.py, or None when numba isn't installed
+    sys.path.insert(0, os.path.join(HERE, "GenerativeArtStudio"))
+    try:
+        import fractals
+    except ImportError:
+        return None
+    return fractals
+
+def bounds(w, h, viewport):
+    # Same aspect handling as FractalGenerator.get_bounds
+    x_center, y_center, width = viewport
+    height = width * h / w
+    return (x_center - width / 2, x_center + width / 2, y_center - height / 2, y_center + height / 2)
+
+def engine_runner(engine, fractal_type, w, h, max_iterations, viewport):
+    # A function that renders the case once
+    x_min, x_max, y_min, y_max = bounds(w, h, viewport)
+    if engine == "python":
+        gas = studio()
+        if fractal_type == "mandelbrot":
+            return lambda: gas.compute_mandelbrot(h, w, max_iterations, x_min, x_max, y_min, y_max)
+        return lambda: gas.compute_julia(h, w, max_iterations, x_min, x_max, y_min, y_max, JULIA_C)
+
+    if engine == "numpy":
+        gas = studio()
+        return lambda: gas.compute_fractal_region(fractal_type, h, w, max_iterations,
+                                                  (x_min, x_max, y_min, y_max), JULIA_C,
+                                                  interior_checks=True)
+
+    if engine == "numba":
+        fractals = numba_fractals()
+        # fractals.py spans 3 / zoom horizontally around center
+        zoom = 3.0 / viewport[2]
+        center = (viewport[0], viewport[1])
+        values = fractals.values_buffer(w, h)
+        if fractal_type == "mandelbrot":
+            return lambda: fractals.compute_mandelbrot(values, zoom, max_iterations, center)
+        return lambda: fractals.compute_julia(values, zoom, max_iterations, JULIA_C, center)
+
+    raise ValueError(f"Unknown engine '{engine}'")
+
+def color_runner(mode, w, h):
+    # color_fractal over a fixed full-view Mandelbrot render
+    gas = studio()
+    fractal = gas.compute_fractal_region("mandelbrot", h, w, 256, bounds(w, h, VIEWPORTS["mandelbrot"]["full"]),
+                                         JULIA_C, interior_checks=True)
+    palette = [(20, 30, 80), (80, 160, 220), (240, 220, 120), (200, 60, 40)]
+    histogram = gas.iteration_histogram(fractal) if mode != "linear" else None
+    return lambda: gas.color_fractal(fractal, palette, smooth=True, mode=mode, histogram=histogram)
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def run_case(case, repeat):
+    # Runs in a fresh process: compile/warm up on a tiny frame, then time
+    # the case and record its memory high-water mark
+    if case["engine"] == "color_fractal":
+        make = lambda w, h: color_runner(case["mode"], w, h)
+    else:
+        make = lambda w, h: engine_runner(case["engine"], case["fractal"], w, h,
+                                          case["max_iterations"], case["viewport_bounds"])
+    make(8, 6)()
+
+    w, h = case["resolution"]
+    render = make(w, h)
+    rss_before = peak_rss_mb()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render()
+        times.append(time.perf_counter() - start)
+    rss_after = peak_rss_mb()
+
+    # Tracing slows allocation down, so memory gets a separate untimed run
+    tracemalloc.start()
+    render()
+    traced_peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    tracemalloc.stop()
+
+    seconds = min(times)
+    pixels = w * h / 1e6
+    result = dict(case)
+    result.pop("viewport_bounds", None)
+    result["seconds"] = seconds
+    if case["engine"] == "color_fractal":
+        result["throughput"] = pixels / seconds
+        result["unit"] = "MPix/s"
+    else:
+        result["throughput"] = pixels * case["max_iterations"] / seconds
+        result["unit"] = "MPix-iter/s"
+    # NumPy allocations are traced; the RSS growth also covers numba's heap
+    result["peak_mb"] = max(traced_peak, rss_after - rss_before) if rss_before is not None else traced_peak
+    return result
+
+def benchmark_cases(engines):
+    cases = []
+    for engine in engines:
+        if engine == "color_fractal":
+            for mode in COLOR_MODES:
+                for resolution in RESOLUTIONS:
+                    cases.append({"engine": engine, "mode": mode, "resolution": resolution})
+            continue
+        resolutions = PYTHON_RESOLUTIONS if engine == "python" else RESOLUTIONS
+        iterations = PYTHON_ITERATIONS if engine == "python" else ITERATIONS
+        for fractal_type, viewports in VIEWPORTS.items():
+            for name, viewport in viewports.items():
+                for resolution in resolutions:
+                    for max_iterations in iterations:
+                        cases.append({"engine": engine, "fractal": fractal_type, "viewport": name,
+                                      "viewport_bounds": viewport, "resolution": resolution,
+                                      "max_iterations": max_iterations})
+    return cases
+
+def case_key(result):
+    resolution = "x".join(str(v) for v in result["resolution"])
+    if result["engine"] == "color_fractal":
+        return f"color_fractal/{result['mode']}/{resolution}"
+    return (f"{result['engine']}/{result['fractal']}/{result['viewport']}/"
+            f"{resolution}/{result['max_iterations']}")
+
+def compare(results, baseline, tolerance):
+    # Cases slower or hungrier than the baseline by more than tolerance
+    previous = {case_key(r): r for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        old = previous.get(case_key(result))
+        if old is None:
+            continue
+        if result["throughput"] < old["throughput"] * (1 - tolerance):
+            regressions.append(f"{case_key(result)}: {result['throughput']:.1f} {result['unit']} "
+                               f"(baseline {old['throughput']:.1f})")
+        if result["peak_mb"] > old["peak_mb"] * (1 + tolerance) + 1:
+            regressions.append(f"{case_key(result)}: peak {result['peak_mb']:.1f} MB "
+                               f"(baseline {old['peak_mb']:.1f} MB)")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the fractal engines")
+    parser.add_argument("--engines", nargs="+", default=["python", "numpy", "numba", "color_fractal"],
+                        help="engines to run: python, numpy, numba, color_fractal")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case (best is kept)")
+    parser.add_argument("--output", default="fractal_benchmark.json", help="where to write the results")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline results to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="allowed slowdown/growth vs baseline")
+    args = parser.parse_args()
+
+    engines = list(args.engines)
+    if "numba" in engines and numba_fractals() is None:
+        print("numba is not installed, skipping the numba engine")
+        engines.remove("numba")
+
+    results = []
+    spawn = multiprocessing.get_context("spawn")
+    for case in benchmark_cases(engines):
+        with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as pool:
+            result = pool.submit(run_case, case, args.repeat).result()
+        results.append(result)
+        print(f"{case_key(result):50s} {result['throughput']:10.1f} {result['unit']:12s} "
+              f"{result['peak_mb']:8.1f} MB")
+
+    report = {
+        "machine": {"platform": platform.platform(), "python": platform.python_version(),
+                    "numpy": np.__version__, "cpu_count": os.cpu_count()},
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline to compare against; run with --save-baseline first")
+        return 0
+    with open(args.baseline) as f:
+        regressions = compare(results, json.load(f), args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    print(f"{len(regressions)} regression(s) against {args.baseline}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
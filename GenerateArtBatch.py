@@ -0,0 +1,126 @@
+import os
+import sys
+import json
+import random
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Render without a window; must be set before pygame is imported
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+import pygame
+
+from GenerateArtStudio import FractalGenerator, FlameGenerator, LSystemGenerator, shutdown_render_pool
+
+# Parameter files are JSON: one job object or a list of them, e.g.
+#
+#   {"generator": "fractal", "output": "julia_01.png", "width": 1920, "height": 1080,
+#    "seed": 7, "params": {"type": "julia", "julia_c": [-0.8, 0.156], "max_iterations": 500}}
+#
+# "generator" is "fractal", "flame" or "lsystem". "params" are set as
+# attributes on the generator (they must already exist), and "generate" holds
+# keyword arguments for the flame renderer (iterations, final_iterations).
+# Fractal jobs can ask for "antialias": true to supersample edge pixels.
+# Relative outputs are written below --output-dir.
+
+DEFAULT_WIDTH, DEFAULT_HEIGHT = 1000, 800
+
+def load_jobs(paths, output_dir):
+    jobs = []
+    for path in paths:
+        with open(path) as f:
+            data = json.load(f)
+        entries = data if isinstance(data, list) else [data]
+        stem = os.path.splitext(os.path.basename(path))[0]
+        for i, job in enumerate(entries):
+            job = dict(job)
+            output = job.get("output") or f"{stem}_{i:04d}.png"
+            job["output"] = os.path.join(output_dir, output)
+            jobs.append(job)
+    return jobs
+
+def apply_params(generator, params):
+    for name, value in params.items():
+        if not hasattr(generator, name):
+            raise ValueError(f"{type(generator).__name__} has no parameter '{name}'")
+        if name == "julia_c":
+            value = complex(*value) if isinstance(value, (list, tuple)) else complex(value)
+        elif name == "palette":
+            value = [tuple(color) for color in value]
+        setattr(generator, name, value)
+
+def render_job(job):
+    # Runs in a worker process; returns the output path. Parameters like
+    # render_mode "tiled" or workers > 1 start a process pool inside the
+    # job, which is shut down again so the batch worker can exit.
+    try:
+        return render_to_file(job)
+    finally:
+        shutdown_render_pool()
+
+def render_to_file(job):
+    if "seed" in job:
+        random.seed(job["seed"])
+        np.random.seed(job["seed"])
+    width = job.get("width", DEFAULT_WIDTH)
+    height = job.get("height", DEFAULT_HEIGHT)
+    kind = job.get("generator", "fractal")
+
+    if kind == "fractal":
+        generator = FractalGenerator()
+        generator.workers = 1  # Parallelism comes from --jobs
+        apply_params(generator, job.get("params", {}))
+        surface = generator.generate(width, height)
+        if job.get("antialias") and generator.last_distance is None:
+            surface = generator.antialias(generator.last_fractal)
+    elif kind == "flame":
+        generator = FlameGenerator(width, height)
+        generator.workers = 1
+        apply_params(generator, job.get("params", {}))
+        surface = generator.generate(**job.get("generate", {}))
+    elif kind == "lsystem":
+        generator = LSystemGenerator(width, height)
+        apply_params(generator, job.get("params", {}))
+        surface = generator.generate()
+    else:
+        raise ValueError(f"Unknown generator '{kind}'")
+
+    output = job["output"]
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    pygame.image.save(surface, output)
+    return output
+
+def main():
+    parser = argparse.ArgumentParser(description="Render Generative Art Studio images without a window")
+    parser.add_argument("params", nargs="+", help="JSON parameter files")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="renders to run in parallel")
+    parser.add_argument("--output-dir", "-o", default="output", help="directory for relative outputs")
+    args = parser.parse_args()
+
+    jobs = load_jobs(args.params, args.output_dir)
+    failures = 0
+
+    if args.jobs <= 1:
+        for job in jobs:
+            try:
+                print(f"Saved {render_job(job)}")
+            except Exception as e:
+                failures += 1
+                print(f"Error rendering {job['output']}: {e}")
+    else:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            futures = {pool.submit(render_job, job): job for job in jobs}
+            for future in as_completed(futures):
+                try:
+                    print(f"Saved {future.result()}")
+                except Exception as e:
+                    failures += 1
+                    print(f"Error rendering {futures[future]['output']}: {e}")
+
+    print(f"Rendered {len(jobs) - failures}/{len(jobs)} images")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,22 +4,54 @@ import math
 import random
 import colorsys
 import os
+import copy
+import queue
+import shutil
+import tempfile
+import threading
 from datetime import datetime
-
-# Initialize Pygame
-pygame.init()
+from collections import OrderedDict
+from functools import lru_cache
+from decimal import Decimal, localcontext
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 
 # Constants
 WIDTH, HEIGHT = 1000, 800
 PREVIEW_WIDTH, PREVIEW_HEIGHT = 500, 400
 UI_PANEL_WIDTH = 300
 TOTAL_WIDTH = WIDTH + UI_PANEL_WIDTH
+TILE_SIZE = 128  # Tile edge in pixels for the multi-core fractal renderer
+PROGRESSIVE_STEPS = (8, 4, 2, 1)  # Pixel strides for coarse-to-fine fractal passes
+# Auto precision only uses float32 where it matched float64 on every pixel
+# of 14 test views (Mandelbrot and Julia, 400x320): up to 24 iterations at
+# pixel spacings of 1e-3 and more. Rounding error grows with the iteration
+# count: at 50 iterations ~0.003% of pixels end up more than one iteration
+# off, at 500 iterations 0.3% (spacing 1e-2) to 1.5% (spacing 1e-4).
+FLOAT32_MIN_SPACING = 1e-3  # Smallest pixel spacing rendered with the float32 kernel
+FLOAT32_MAX_ITERATIONS = 24  # Highest iteration cap rendered with the float32 kernel
+FLOAT64_MIN_SPACING = 1e-13  # Below this pixel spacing, switch to perturbation (extended)
+SUBDIVIDE_MIN_SIZE = 16  # Rectangles this small are brute-forced by the subdivision renderer
+PERIODICITY_TOLERANCE = 1e-13  # Orbit distance treated as a repeated (periodic) point
+CACHE_TILE_SIZE = 64  # Tile edge in pixels for the iteration tile cache
+TILE_CACHE_BYTES = 256 * 1024 * 1024  # Default memory budget of the tile cache
+PALETTE_LUT_RESOLUTION = 64  # Interpolated steps between palette colors for smooth coloring
+SUPERSAMPLE_GRID = 4  # Jittered sub-pixel samples per axis for antialiased exports
+SUPERSAMPLE_THRESHOLD = 1.0  # Escape-value jump to a neighbour that marks an edge pixel
+REPROJECT_THRESHOLD = 0.5  # Max escape-value spread for a reprojected pixel to be reused
+REPROJECT_REFRESH = 10  # Zoom frames between full recomputes, to stop drift
+JULIA_BATCH_FRAMES = 8  # Julia sweep frames iterated together in one batch
+DE_ESCAPE_RADIUS = 1000.0  # Large bailout keeps the distance estimate accurate
+DE_GLOW_PIXELS = 1.5  # Distance in pixels over which the boundary outline fades out
+FLAME_WALKERS = 32768  # Chaos-game walkers advanced together by the flame generator
+FLAME_WARMUP_STEPS = 20  # Unplotted steps that let each walker reach the attractor
+FLAME_CHOICE_TABLE = 4096  # Entries in the weighted function-choice lookup table
 
-# Canvas setup
-screen = pygame.display.set_mode((TOTAL_WIDTH, HEIGHT))
-pygame.display.set_caption("Generative Art Studio")
-canvas = pygame.Surface((WIDTH, HEIGHT))
-preview_canvas = pygame.Surface((PREVIEW_WIDTH, PREVIEW_HEIGHT))
+# Canvas setup. The window and fonts are only created by init_display(),
+# so the generators can be imported for headless batch renders.
+screen = None
+canvas = None
+preview_canvas = None
 
 # UI settings
 UI_BG_COLOR = (30, 30, 40)
@@ -27,9 +59,23 @@ UI_TEXT_COLOR = (230, 230, 230)
 UI_ACCENT_COLOR = (100, 130, 250)
 UI_BUTTON_COLOR = (60, 70, 90)
 UI_BUTTON_HOVER_COLOR = (80, 90, 120)
-font_small = pygame.font.SysFont("Arial", 16)
-font_medium = pygame.font.SysFont("Arial", 20)
-font_large = pygame.font.SysFont("Arial", 24)
+font_small = None
+font_medium = None
+font_large = None
+
+def init_display():
+    # Initialize Pygame and open the studio window (once)
+    global screen, canvas, preview_canvas, font_small, font_medium, font_large
+    if screen is not None:
+        return
+    pygame.init()
+    screen = pygame.display.set_mode((TOTAL_WIDTH, HEIGHT))
+    pygame.display.set_caption("Generative Art Studio")
+    canvas = pygame.Surface((WIDTH, HEIGHT))
+    preview_canvas = pygame.Surface((PREVIEW_WIDTH, PREVIEW_HEIGHT))
+    font_small = pygame.font.SysFont("Arial", 16)
+    font_medium = pygame.font.SysFont("Arial", 20)
+    font_large = pygame.font.SysFont("Arial", 24)
 
 # Color palettes
 def generate_complementary_palette(base_hue, saturation=0.7, lightness_values=[0.3, 0.5, 0.7, 0.9]):
@@ -99,10 +145,21 @@ def generate_random_palette():
     else:
         return generate_triadic_palette(base_hue)
 
+# Render cancellation
+class RenderCancelled(Exception):
+    # Raised inside a render once its cancel event is set
+    pass
+
+def check_cancelled(cancel):
+    # cancel is a threading.Event, or None for renders that can't be cancelled
+    if cancel is not None and cancel.is_set():
+        raise RenderCancelled()
+
 # Mandelbrot and Julia Set Generation
-def compute_mandelbrot(h, w, max_iterations, x_min, x_max, y_min, y_max):
+def compute_mandelbrot(h, w, max_iterations, x_min, x_max, y_min, y_max, cancel=None):
     result = np.zeros((h, w))
     for y in range(h):
+        check_cancelled(cancel)
         for x in range(w):
             # Convert pixel coordinates to complex plane
             c_real = x_min + (x / w) * (x_max - x_min)
@@ -126,9 +183,10 @@ def compute_mandelbrot(h, w, max_iterations, x_min, x_max, y_min, y_max):
                 
     return result
 
-def compute_julia(h, w, max_iterations, x_min, x_max, y_min, y_max, c):
+def compute_julia(h, w, max_iterations, x_min, x_max, y_min, y_max, c, cancel=None):
     result = np.zeros((h, w))
     for y in range(h):
+        check_cancelled(cancel)
         for x in range(w):
             # Convert pixel coordinates to complex plane
             z_real = x_min + (x / w) * (x_max - x_min)
@@ -151,26 +209,692 @@ def compute_julia(h, w, max_iterations, x_min, x_max, y_min, y_max, c):
                 
     return result
 
-def color_fractal(fractal, palette):
+# Vectorized escape-time engine
+def pixel_grid(h, w, x_min, x_max, y_min, y_max, rows=None, cols=None):
+    # Same pixel -> complex plane mapping as the per-pixel loops above.
+    # rows/cols select a sub-grid (e.g. a tile) of the full h x w viewport.
+    if rows is None:
+        rows = np.arange(h)
+    if cols is None:
+        cols = np.arange(w)
+    xs = x_min + (np.asarray(cols) / w) * (x_max - x_min)
+    ys = y_min + (np.asarray(rows) / h) * (y_max - y_min)
+    return xs[np.newaxis, :] + 1j * ys[:, np.newaxis]
+
+def escape_time(z, c, max_iterations, periodicity_checks=False, stats=None,
+                start_iteration=0, state=None, dtype=np.float64, cancel=None):
+    # Iterate z = z**2 + c over flat arrays, only touching points that have
+    # not escaped yet. Returns the same smooth values as the pure Python loop
+    # (0 for points that never escape). Real and imaginary parts are kept in
+    # separate float arrays so the arithmetic matches Python's complex type
+    # bit for bit (NumPy's complex multiply and abs round differently).
+    #
+    # With periodicity_checks, each orbit is compared against a copy saved at
+    # every power-of-two iteration (Brent's cycle detection); an orbit that
+    # returns to it is periodic, so the point is in the set and retired early.
+    #
+    # start_iteration continues orbits that were stopped at that iteration.
+    # If a state dict is passed it receives the escape iteration of every
+    # point (-1 if it did not escape) and the z values of the points that
+    # were still iterating when max_iterations was reached.
+    #
+    # dtype is the float type of the orbit arithmetic: float32 halves the
+    # memory traffic but drifts from float64 after a few dozen iterations
+    # (see FLOAT32_MAX_ITERATIONS).
+    # A set cancel event aborts between iterations with RenderCancelled.
+    z = np.asarray(z, dtype=np.complex128)
+    c = np.broadcast_to(np.asarray(c, dtype=np.complex128), z.shape).ravel()
+    z = z.ravel()
+    zr, zi = z.real.astype(dtype), z.imag.astype(dtype)
+    cr, ci = c.real.astype(dtype), c.imag.astype(dtype)
+    result = np.zeros(z.shape)
+    active = np.arange(z.size)
+    if state is not None:
+        counts = np.full(z.size, -1)
+    
+    if periodicity_checks:
+        saved_r = np.full(z.size, np.nan, dtype=dtype)
+        saved_i = np.full(z.size, np.nan, dtype=dtype)
+        tolerance = max(PERIODICITY_TOLERANCE, float(np.finfo(dtype).eps))
+        next_save = 1
+        while next_save < start_iteration:
+            next_save *= 2
+
+    for n in range(start_iteration, max_iterations):
+        check_cancelled(cancel)
+        zr2, zi2 = zr * zr, zi * zi
+        # Cheap squared-magnitude test first; hypot (what abs() uses) only
+        # decides the points close enough to the radius to matter
+        escaped = zr2 + zi2 > 3.99
+        if escaped.any():
+            magnitude = np.hypot(zr[escaped], zi[escaped])
+            escaped[escaped] = magnitude > 2.0
+            magnitude = magnitude[magnitude > 2.0]
+        finished = escaped
+
+        if periodicity_checks:
+            periodic = ((np.abs(zr - saved_r) < tolerance) &
+                        (np.abs(zi - saved_i) < tolerance))
+            if periodic.any():
+                finished = escaped | periodic
+                if stats is not None:
+                    count = int(periodic.sum())
+                    stats["periodic_points"] = stats.get("periodic_points", 0) + count
+                    stats["iterations_saved"] = stats.get("iterations_saved", 0) + count * (max_iterations - n)
+
+        if finished.any():
+            if escaped.any():
+                # Smooth coloring
+                result[active[escaped]] = n + 1 - np.log(np.log(magnitude)) / np.log(2)
+                if state is not None:
+                    counts[active[escaped]] = n
+
+            # Drop finished points so later iterations only see active ones
+            still_active = ~finished
+            zr, zi = zr[still_active], zi[still_active]
+            zr2, zi2 = zr2[still_active], zi2[still_active]
+            cr, ci = cr[still_active], ci[still_active]
+            active = active[still_active]
+            if periodicity_checks:
+                saved_r, saved_i = saved_r[still_active], saved_i[still_active]
+            if active.size == 0:
+                break
+
+        if periodicity_checks and n == next_save:
+            saved_r, saved_i = zr.copy(), zi.copy()
+            next_save *= 2
+
+        zr, zi = zr2 - zi2 + cr, zr * zi + zi * zr + ci
+
+    if state is not None:
+        state["counts"] = counts
+        state["active"] = active
+        state["z"] = np.empty(zr.size, dtype=np.complex128)
+        state["z"].real, state["z"].imag = zr, zi
+    return result
+
+def in_cardioid_or_bulb(c):
+    # Points in the main cardioid or the period-2 bulb never escape
+    x, y = c.real, c.imag
+    q = (x - 0.25) ** 2 + y * y
+    cardioid = q * (q + (x - 0.25)) <= 0.25 * y * y
+    bulb = (x + 1) ** 2 + y * y <= 0.0625
+    return cardioid | bulb
+
+def compute_mandelbrot_numpy(h, w, max_iterations, x_min, x_max, y_min, y_max):
+    c = pixel_grid(h, w, x_min, x_max, y_min, y_max)
+    return escape_time(np.zeros_like(c), c, max_iterations).reshape(h, w)
+
+def compute_julia_numpy(h, w, max_iterations, x_min, x_max, y_min, y_max, c):
+    z = pixel_grid(h, w, x_min, x_max, y_min, y_max)
+    return escape_time(z, c, max_iterations).reshape(h, w)
+
+def compute_fractal_points(fractal_type, max_iterations, points, julia_c,
+                           interior_checks=False, stats=None, dtype=np.float64, cancel=None):
+    # Escape-time values for an arbitrary array of complex-plane points.
+    # interior_checks skips the Mandelbrot cardioid/bulb analytically and
+    # turns on periodicity detection; stats collects the iterations saved.
+    points = np.asarray(points, dtype=np.complex128).ravel()
+    if fractal_type == "mandelbrot":
+        if not interior_checks:
+            return escape_time(np.zeros_like(points), points, max_iterations, dtype=dtype,
+                               cancel=cancel)
+        
+        inside = in_cardioid_or_bulb(points)
+        if stats is not None:
+            count = int(inside.sum())
+            stats["cardioid_points"] = stats.get("cardioid_points", 0) + count
+            stats["iterations_saved"] = stats.get("iterations_saved", 0) + count * max_iterations
+        
+        result = np.zeros(points.shape)
+        outside = points[~inside]
+        result[~inside] = escape_time(np.zeros_like(outside), outside, max_iterations,
+                                      periodicity_checks=True, stats=stats, dtype=dtype, cancel=cancel)
+        return result
+    else:  # julia
+        return escape_time(points, julia_c, max_iterations,
+                           periodicity_checks=interior_checks, stats=stats, dtype=dtype, cancel=cancel)
+
+def compute_fractal_region(fractal_type, h, w, max_iterations, bounds, julia_c, rows=None, cols=None,
+                           interior_checks=False, stats=None, dtype=np.float64, cancel=None):
+    # Escape-time values for a sub-grid of the viewport (whole grid by default)
+    grid = pixel_grid(h, w, *bounds, rows=rows, cols=cols)
+    return compute_fractal_points(fractal_type, max_iterations, grid, julia_c,
+                                  interior_checks, stats, dtype, cancel).reshape(grid.shape)
+
+# Mariani-Silver rectangle subdivision
+def compute_fractal_subdivided(fractal_type, h, w, max_iterations, bounds, julia_c,
+                               min_size=SUBDIVIDE_MIN_SIZE, interior_checks=False, stats=None,
+                               dtype=np.float64, cancel=None):
+    # Compute only rectangle borders. A border lying entirely in the set
+    # (value 0) encloses only in-set pixels (the set has no holes), so the
+    # interior is left at 0 without iterating it. Otherwise the rectangle is
+    # split into quadrants that share the already-computed border lines.
+    # Bands of equal escape count are split too, because their interiors
+    # still differ in the smooth coloring value.
+    result = np.zeros((h, w))
+    computed = np.zeros((h, w), dtype=bool)
+    xs = pixel_grid(1, w, *bounds)[0].real
+    ys = pixel_grid(h, 1, *bounds)[:, 0].imag
+    
+    def compute_mask(mask):
+        mask &= ~computed
+        rows, cols = np.nonzero(mask)
+        if rows.size:
+            points = xs[cols] + 1j * ys[rows]
+            result[rows, cols] = compute_fractal_points(fractal_type, max_iterations, points, julia_c,
+                                                        interior_checks, stats, dtype, cancel)
+            computed[rows, cols] = True
+    
+    rects = [(0, h, 0, w)]
+    while rects:
+        # Each level evaluates all of its borders in one vectorized batch
+        border = np.zeros((h, w), dtype=bool)
+        for y0, y1, x0, x1 in rects:
+            border[y0, x0:x1] = border[y1 - 1, x0:x1] = True
+            border[y0:y1, x0] = border[y0:y1, x1 - 1] = True
+        compute_mask(border)
+        
+        brute_force = np.zeros((h, w), dtype=bool)
+        next_rects = []
+        for y0, y1, x0, x1 in rects:
+            if (not result[y0, x0:x1].any() and not result[y1 - 1, x0:x1].any() and
+                    not result[y0:y1, x0].any() and not result[y0:y1, x1 - 1].any()):
+                computed[y0:y1, x0:x1] = True
+            elif y1 - y0 <= min_size or x1 - x0 <= min_size:
+                brute_force[y0:y1, x0:x1] = True
+            else:
+                ym, xm = (y0 + y1) // 2, (x0 + x1) // 2
+                next_rects.extend([(y0, ym + 1, x0, xm + 1), (y0, ym + 1, xm, x1),
+                                   (ym, y1, x0, xm + 1), (ym, y1, xm, x1)])
+        compute_mask(brute_force)
+        rects = next_rects
+    
+    return result
+
+# Zoom animation reprojection
+def reproject_fractal(previous, previous_bounds, bounds, threshold=REPROJECT_THRESHOLD):
+    # Resample the previous frame into the new viewport. A new pixel reuses
+    # the bilinear blend of the four previous samples around it when they
+    # are all in the set, or all outside it within threshold of each other.
+    # Returns the reprojected values and the mask of pixels to recompute
+    # (outside the previous frame, or too much detail to interpolate).
+    h, w = previous.shape
+    px_min, px_max, py_min, py_max = previous_bounds
+    grid = pixel_grid(h, w, *bounds)
+    fx = (grid.real - px_min) / (px_max - px_min) * w
+    fy = (grid.imag - py_min) / (py_max - py_min) * h
+    
+    valid = (fx >= 0) & (fx <= w - 1) & (fy >= 0) & (fy <= h - 1)
+    x0 = np.clip(np.floor(fx), 0, w - 2).astype(np.intp)
+    y0 = np.clip(np.floor(fy), 0, h - 2).astype(np.intp)
+    tx = np.clip(fx - x0, 0, 1)
+    ty = np.clip(fy - y0, 0, 1)
+    
+    v00, v01 = previous[y0, x0], previous[y0, x0 + 1]
+    v10, v11 = previous[y0 + 1, x0], previous[y0 + 1, x0 + 1]
+    corners = np.stack([v00, v01, v10, v11])
+    inside = (corners == 0).all(axis=0)
+    outside = (corners != 0).all(axis=0) & (corners.max(axis=0) - corners.min(axis=0) <= threshold)
+    
+    values = (v00 * (1 - tx) * (1 - ty) + v01 * tx * (1 - ty) +
+              v10 * (1 - tx) * ty + v11 * tx * ty)
+    values[inside] = 0
+    recompute = ~(valid & (inside | outside))
+    return values, recompute
+
+# Distance estimation
+def distance_estimate(z, c, max_iterations, derivative, escape_radius=DE_ESCAPE_RADIUS, cancel=None):
+    # Iterate z = z**2 + c together with its derivative dz' = 2 z dz + derivative
+    # (1 w.r.t. c for Mandelbrot, 0 with dz0 = 1 w.r.t. z for Julia) and
+    # return the distance estimate |z| log|z| / |dz| for escaped points.
+    # Points that never escape get 0.
+    z = np.array(z, dtype=np.complex128).ravel()
+    c = np.broadcast_to(np.asarray(c, dtype=np.complex128), z.shape).ravel()
+    dz = np.full(z.shape, 1 - derivative, dtype=np.complex128)
+    result = np.zeros(z.shape)
+    active = np.arange(z.size)
+    
+    for _ in range(max_iterations):
+        check_cancelled(cancel)
+        dz = 2 * z * dz + derivative
+        z = z * z + c
+        magnitude = np.abs(z)
+        escaped = magnitude > escape_radius
+        if escaped.any():
+            result[active[escaped]] = (magnitude[escaped] * np.log(magnitude[escaped]) /
+                                       np.maximum(np.abs(dz[escaped]), 1e-300))
+            still_active = ~escaped
+            z, c, dz = z[still_active], c[still_active], dz[still_active]
+            active = active[still_active]
+            if active.size == 0:
+                break
+    
+    return result
+
+def compute_fractal_distance(fractal_type, h, w, max_iterations, bounds, julia_c, cancel=None):
+    # Boundary distance of every pixel, in pixels
+    grid = pixel_grid(h, w, *bounds).ravel()
+    if fractal_type == "mandelbrot":
+        distance = distance_estimate(np.zeros_like(grid), grid, max_iterations, derivative=1,
+                                     cancel=cancel)
+    else:  # julia
+        distance = distance_estimate(grid, julia_c, max_iterations, derivative=0, cancel=cancel)
+    x_min, x_max = bounds[:2]
+    spacing = (x_max - x_min) / w
+    # Degenerate derivatives give huge estimates; cap them far from the set
+    return np.minimum(distance.reshape(h, w), spacing * 1e9) / spacing
+
+def shade_distance(distance, palette, glow=DE_GLOW_PIXELS):
+    # Palette bands by log distance, with a bright outline that fades out
+    # over `glow` pixels from the boundary; the set itself stays black
+    h, w = distance.shape
+    outside = distance > 0
+    lut = palette_lut(tuple(palette)).astype(np.float64)
+    index = (np.log2(distance + 1) * 2).astype(np.intp) % len(lut)
+    outline = np.exp(-distance / glow)[..., np.newaxis]
+    rgb = lut[index] * (1 - outline) + 255 * outline
+    rgb[~outside] = 0
+    
+    surface = pygame.Surface((w, h))
+    pygame.surfarray.blit_array(surface, np.round(rgb).astype(np.uint8).swapaxes(0, 1))
+    return surface
+
+# Batched Julia parameter sweeps
+def julia_rotation_values(c, frames, angle=0.05):
+    # c rotated by angle per frame, as the Julia recording does
+    return c * np.exp(1j * angle * np.arange(1, frames + 1))
+
+def compute_julia_batch(h, w, max_iterations, bounds, c_values, interior_checks=False):
+    # Several Julia frames in one escape-time pass: the pixel grid is built
+    # once and repeated for every c value
+    grid = pixel_grid(h, w, *bounds).ravel()
+    z = np.tile(grid, len(c_values))
+    c = np.repeat(np.asarray(c_values, dtype=np.complex128), grid.size)
+    values = escape_time(z, c, max_iterations, periodicity_checks=interior_checks)
+    return values.reshape(len(c_values), h, w)
+
+def _render_julia_frames(folder, start, h, w, max_iterations, bounds, c_values, palette,
+                         smooth=False, mode="linear", interior_checks=False):
+    # Render one batch of sweep frames and write them as PNGs, so only the
+    # file names travel back from a worker process
+    filenames = []
+    fractals = compute_julia_batch(h, w, max_iterations, bounds, c_values, interior_checks)
+    for i, fractal in enumerate(fractals):
+        filename = f"{folder}/frame_{start + i:04d}.png"
+        pygame.image.save(color_fractal(fractal, palette, smooth, mode), filename)
+        filenames.append(filename)
+    return filenames
+
+def render_julia_sweep(folder, h, w, max_iterations, bounds, c_values, palette, smooth=False,
+                       mode="linear", interior_checks=False, batch_frames=JULIA_BATCH_FRAMES, workers=1):
+    # Yields the frame file names in order as they are written. With
+    # workers > 1 the batches are spread over the render pool.
+    batches = [(start, c_values[start:start + batch_frames])
+               for start in range(0, len(c_values), batch_frames)]
+    args = (h, w, max_iterations, bounds)
+    options = (palette, smooth, mode, interior_checks)
+    
+    if workers > 1:
+        pool = get_render_pool(workers)
+        futures = [pool.submit(_render_julia_frames, folder, start, *args, batch, *options)
+                   for start, batch in batches]
+        for future in futures:
+            yield from future.result()
+    else:
+        for start, batch in batches:
+            yield from _render_julia_frames(folder, start, *args, batch, *options)
+
+# Perturbation deep zoom
+def compute_reference_orbit(x_center, y_center, max_iterations, zoom, julia_c=None):
+    # High-precision orbit of the view center, rounded to complex128 per step.
+    # Enough digits to resolve a pixel at this zoom plus some headroom.
+    # Mandelbrot orbits start at 0 with c = center; Julia orbits start at the
+    # center with c = julia_c.
+    digits = max(30, int(-math.log10(zoom)) + 30)
+    with localcontext() as ctx:
+        ctx.prec = digits
+        if julia_c is None:
+            c_real, c_imag = Decimal(x_center), Decimal(y_center)
+            z_real, z_imag = Decimal(0), Decimal(0)
+        else:
+            c_real, c_imag = Decimal(julia_c.real), Decimal(julia_c.imag)
+            z_real, z_imag = Decimal(x_center), Decimal(y_center)
+        orbit = [complex(float(z_real), float(z_imag))]
+        for _ in range(max_iterations):
+            z_real, z_imag = (z_real * z_real - z_imag * z_imag + c_real,
+                              2 * z_real * z_imag + c_imag)
+            orbit.append(complex(float(z_real), float(z_imag)))
+            if z_real * z_real + z_imag * z_imag > 4:
+                break
+    return np.array(orbit)
+
+def compute_fractal_perturbation(fractal_type, h, w, max_iterations, x_center, y_center, zoom, julia_c,
+                                 cancel=None):
+    # Every pixel is iterated as a float64 offset dz from the reference orbit Z:
+    #   dz' = (2Z + dz) dz + dc
+    # with dc the pixel offset for Mandelbrot, or dc = 0 and dz0 the pixel
+    # offset for Julia. When |Z + dz| < |dz| the offset has lost its precision
+    # against the reference (a glitch), so the pixel is rebased onto the start
+    # of the orbit with dz = Z + dz - Z0. The same happens when the reference
+    # escapes.
+    julia = fractal_type == "julia"
+    orbit = compute_reference_orbit(x_center, y_center, max_iterations, zoom,
+                                    julia_c if julia else None)
+    last = len(orbit) - 1
+    
+    aspect_ratio = w / h
+    dx = (np.arange(w) / w - 0.5) * zoom
+    dy = (np.arange(h) / h - 0.5) * zoom / aspect_ratio
+    offsets = (dx[np.newaxis, :] + 1j * dy[:, np.newaxis]).ravel()
+    
+    result = np.zeros(offsets.size)
+    active = np.arange(offsets.size)
+    if julia:
+        dz, dc = offsets, np.zeros_like(offsets)
+    else:
+        dz, dc = np.zeros_like(offsets), offsets
+    ref = np.zeros(offsets.size, dtype=np.intp)  # Reference index per pixel
+    
+    for n in range(max_iterations):
+        check_cancelled(cancel)
+        dz = (2 * orbit[ref] + dz) * dz + dc
+        ref += 1
+        z = orbit[ref] + dz
+        magnitude = np.abs(z)
+        
+        escaped = magnitude > 2.0
+        if escaped.any():
+            # Smooth coloring, same as escape_time
+            result[active[escaped]] = n + 2 - np.log(np.log(magnitude[escaped])) / np.log(2)
+            still_active = ~escaped
+            dz, dc, ref, z, magnitude = (dz[still_active], dc[still_active], ref[still_active],
+                                         z[still_active], magnitude[still_active])
+            active = active[still_active]
+            if active.size == 0:
+                break
+        
+        rebase = (magnitude < np.abs(dz)) | (ref == last)
+        if rebase.any():
+            dz[rebase] = z[rebase] - orbit[0]
+            ref[rebase] = 0
+    
+    return result.reshape(h, w)
+
+# Multi-core tiled rendering
+_render_pool = None
+_render_pool_workers = 0
+
+def get_render_pool(workers):
+    # Worker processes are expensive to start, so keep one pool around
+    global _render_pool, _render_pool_workers
+    if _render_pool is None or _render_pool_workers != workers:
+        if _render_pool is not None:
+            _render_pool.shutdown()
+        _render_pool = ProcessPoolExecutor(max_workers=workers)
+        _render_pool_workers = workers
+    return _render_pool
+
+def shutdown_render_pool():
+    # Stop the pool's worker processes; a process that used the pool can't
+    # exit while they are still running
+    global _render_pool, _render_pool_workers
+    if _render_pool is not None:
+        _render_pool.shutdown()
+        _render_pool = None
+        _render_pool_workers = 0
+
+def split_tiles(h, w, tile_size=TILE_SIZE):
+    return [(y, min(y + tile_size, h), x, min(x + tile_size, w))
+            for y in range(0, h, tile_size)
+            for x in range(0, w, tile_size)]
+
+def _render_tile(shm_name, fractal_type, h, w, max_iterations, bounds, julia_c, tile,
+                 interior_checks=False, dtype=np.float64):
+    # Runs in a worker process: compute one tile and write it straight into
+    # the shared result buffer, so only the tile coordinates, counters and
+    # band histogram travel back
+    y0, y1, x0, x1 = tile
+    stats = {}
+    values = compute_fractal_region(fractal_type, h, w, max_iterations, bounds, julia_c,
+                                    rows=np.arange(y0, y1), cols=np.arange(x0, x1),
+                                    interior_checks=interior_checks, stats=stats, dtype=dtype)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        result = np.ndarray((h, w), dtype=np.float64, buffer=shm.buf)
+        result[y0:y1, x0:x1] = values
+        del result  # Release the buffer view before closing
+    finally:
+        shm.close()
+    return tile, stats, iteration_histogram(values)
+
+def compute_fractal_tiled(fractal_type, h, w, max_iterations, bounds, julia_c,
+                          workers=None, tile_size=TILE_SIZE, interior_checks=False, stats=None,
+                          histograms=None, dtype=np.float64, cancel=None):
+    # histograms, if given, collects the band histogram of every tile.
+    # cancel is checked between tiles; tiles not started yet are dropped.
+    workers = workers or os.cpu_count() or 1
+    pool = get_render_pool(workers)
+    shm = shared_memory.SharedMemory(create=True, size=h * w * np.dtype(np.float64).itemsize)
+    try:
+        futures = [pool.submit(_render_tile, shm.name, fractal_type, h, w, max_iterations,
+                               bounds, julia_c, tile, interior_checks, dtype)
+                   for tile in split_tiles(h, w, tile_size)]
+        for future in futures:
+            if cancel is not None and cancel.is_set():
+                for pending in futures:
+                    pending.cancel()
+                raise RenderCancelled()
+            _, tile_stats, tile_histogram = future.result()
+            if histograms is not None:
+                histograms.append(tile_histogram)
+            if stats is not None:
+                for key, value in tile_stats.items():
+                    stats[key] = stats.get(key, 0) + value
+        
+        # Tiles are stitched in place; copy out so the segment can be freed
+        shared = np.ndarray((h, w), dtype=np.float64, buffer=shm.buf)
+        result = shared.copy()
+        del shared
+    finally:
+        shm.close()
+        shm.unlink()
+    return result
+
+# Iteration tile cache
+class FractalTileCache:
+    # LRU cache of raw escape-time tiles. Tiles live on a global pixel grid
+    # for each zoom level (pixel spacing), so a panned view shares every tile
+    # that is still visible and only the newly exposed ones are computed.
+    def __init__(self, max_bytes=TILE_CACHE_BYTES, tile_size=CACHE_TILE_SIZE):
+        self.max_bytes = max_bytes
+        self.tile_size = tile_size
+        self.tiles = OrderedDict()
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        
+    def get(self, key):
+        tile = self.tiles.get(key)
+        if tile is None:
+            self.misses += 1
+            return None
+        self.tiles.move_to_end(key)
+        self.hits += 1
+        return tile
+        
+    def put(self, key, tile):
+        if key in self.tiles:
+            self.used_bytes -= self.tiles.pop(key).nbytes
+        self.tiles[key] = tile
+        self.used_bytes += tile.nbytes
+        
+        # Evict least recently used tiles until we are within budget
+        while self.used_bytes > self.max_bytes and self.tiles:
+            _, evicted = self.tiles.popitem(last=False)
+            self.used_bytes -= evicted.nbytes
+            
+    def clear(self):
+        self.tiles.clear()
+        self.used_bytes = 0
+
+def snapped_origin(h, w, x_center, y_center, zoom):
+    # The cached view is snapped to whole pixels of the zoom level's grid, so
+    # pixel (x, y) sits at ((gx0 + x) * spacing, (gy0 + y) * spacing)
+    spacing = zoom / w
+    gx0 = int(round((x_center - zoom / 2) / spacing))
+    gy0 = int(round((y_center - zoom * h / (2 * w)) / spacing))
+    return gx0, gy0, spacing
+
+def compute_fractal_cached(fractal_type, h, w, max_iterations, x_center, y_center, zoom, julia_c,
+                           cache, interior_checks=False, stats=None, dtype=np.float64, cancel=None):
+    size = cache.tile_size
+    gx0, gy0, spacing = snapped_origin(h, w, x_center, y_center, zoom)
+    
+    params = (fractal_type, julia_c if fractal_type == "julia" else None, max_iterations, spacing,
+              np.dtype(dtype).name)
+    tile_range = [(tx, ty)
+                  for ty in range(gy0 // size, (gy0 + h - 1) // size + 1)
+                  for tx in range(gx0 // size, (gx0 + w - 1) // size + 1)]
+    
+    tiles = {}
+    missing = []
+    for tx, ty in tile_range:
+        tile = cache.get(params + (tx, ty))
+        if tile is None:
+            missing.append((tx, ty))
+        else:
+            tiles[tx, ty] = tile
+    
+    if missing:
+        # All missing tiles go through the engine as one batch
+        offsets = np.arange(size)
+        points = np.concatenate([
+            ((tx * size + offsets)[np.newaxis, :] * spacing +
+             1j * ((ty * size + offsets)[:, np.newaxis] * spacing)).ravel()
+            for tx, ty in missing])
+        values = compute_fractal_points(fractal_type, max_iterations, points, julia_c,
+                                        interior_checks, stats, dtype, cancel)
+        for i, (tx, ty) in enumerate(missing):
+            # A copy, so a cached tile doesn't keep the whole batch alive and
+            # the cache's byte count is what eviction actually frees
+            tile = values[i * size * size:(i + 1) * size * size].reshape(size, size).copy()
+            cache.put(params + (tx, ty), tile)
+            tiles[tx, ty] = tile
+    
+    if stats is not None:
+        stats["tiles_cached"] = stats.get("tiles_cached", 0) + len(tile_range) - len(missing)
+        stats["tiles_computed"] = stats.get("tiles_computed", 0) + len(missing)
+    
+    # Stitch the visible part of every tile into the view
+    result = np.zeros((h, w))
+    for (tx, ty), tile in tiles.items():
+        y0, y1 = max(ty * size, gy0), min((ty + 1) * size, gy0 + h)
+        x0, x1 = max(tx * size, gx0), min((tx + 1) * size, gx0 + w)
+        result[y0 - gy0:y1 - gy0, x0 - gx0:x1 - gx0] = tile[y0 - ty * size:y1 - ty * size,
+                                                             x0 - tx * size:x1 - tx * size]
+    return result
+
+@lru_cache(maxsize=32)
+def palette_lut(palette, smooth=False, resolution=PALETTE_LUT_RESOLUTION):
+    # Palette expanded once into a uint8 lookup table. The smooth table holds
+    # `resolution` interpolated steps from each color to the next (wrapping).
+    colors = np.array(palette, dtype=np.float64)
+    if not smooth:
+        return colors.astype(np.uint8)
+    positions = np.arange(len(palette) * resolution) / resolution
+    lower = positions.astype(np.intp)
+    upper = (lower + 1) % len(palette)
+    t = (positions - lower)[:, np.newaxis]
+    return np.round(colors[lower] * (1 - t) + colors[upper] * t).astype(np.uint8)
+
+def iteration_histogram(fractal):
+    # Number of outside-the-set pixels per integer escape band
+    bands = np.maximum(np.floor(fractal[fractal != 0]), 0).astype(np.intp)
+    return np.bincount(bands)
+
+def merge_histograms(histograms):
+    # Sum band histograms of different lengths, e.g. one per tile or pass
+    histograms = [h for h in histograms if h is not None]
+    if not histograms:
+        return None
+    merged = np.zeros(max(len(h) for h in histograms), dtype=np.int64)
+    for h in histograms:
+        merged[:len(h)] += h
+    return merged
+
+def equalized_position(fractal, histogram, continuous=False):
+    # Map escape values to [0, 1] through the cumulative distribution of the
+    # bands, so every palette color covers a similar share of the pixels.
+    # continuous spreads each band linearly across its share using the
+    # fractional (smooth) part of the value.
+    total = max(histogram.sum(), 1)
+    cdf = np.concatenate([[0], np.cumsum(histogram)]) / total
+    bands = np.clip(np.floor(fractal), 0, len(histogram) - 1).astype(np.intp)
+    if not continuous:
+        return cdf[bands + 1]
+    fraction = np.clip(fractal - bands, 0, 1)
+    return cdf[bands] + fraction * (cdf[bands + 1] - cdf[bands])
+
+def palette_indices(fractal, palette, smooth=False, mode="linear", histogram=None, max_val=None):
+    # Index of every value in palette_lut(), or len(lut) (black) for points
+    # in the set. mode: "linear" (scaled by the maximum), "histogram"
+    # (equalized bands) or "cdf" (equalized, continuous). histogram and
+    # max_val can be passed in, e.g. merged from tiles or taken from the
+    # full frame when coloring extra samples.
+    lut_size = len(palette_lut(tuple(palette), smooth))
+    if mode == "linear":
+        if max_val is None:
+            max_val = np.max(fractal)
+        if max_val == 0:
+            max_val = 1  # Avoid division by zero
+        scaled = fractal / max_val
+    else:
+        if histogram is None:
+            histogram = iteration_histogram(fractal)
+        if len(histogram) == 0:
+            histogram = np.ones(1, dtype=np.int64)
+        scaled = equalized_position(fractal, histogram, continuous=(mode == "cdf"))
+        
+    position = scaled * (len(palette) - 1)
+    if smooth:
+        position = position * PALETTE_LUT_RESOLUTION
+    index = position.astype(np.intp) % lut_size
+    index[fractal == 0] = lut_size
+    return index
+
+def color_fractal(fractal, palette, smooth=False, mode="linear", histogram=None):
     h, w = fractal.shape
     surface = pygame.Surface((w, h))
     
-    max_val = np.max(fractal)
-    if max_val == 0:
-        max_val = 1  # Avoid division by zero
-        
-    for y in range(h):
-        for x in range(w):
-            if fractal[y, x] == 0:
-                # Point is in the set
-                surface.set_at((x, y), (0, 0, 0))
-            else:
-                # Point is outside the set
-                color_index = int((fractal[y, x] / max_val * (len(palette) - 1))) % len(palette)
-                surface.set_at((x, y), palette[color_index])
-                
+    # Pack the table into the surface's pixel format, with black appended as
+    # the last entry for points in the set
+    lut = palette_lut(tuple(palette), smooth).astype(np.uint32)
+    lut = np.vstack([lut, np.zeros((1, 3), dtype=np.uint32)])
+    shifts, losses = surface.get_shifts(), surface.get_losses()
+    mapped = sum((lut[:, i] >> losses[i]) << shifts[i] for i in range(3))
+    
+    # Look every pixel up in the table at once
+    index = palette_indices(fractal, palette, smooth, mode, histogram)
+    pygame.surfarray.blit_array(surface, mapped[index].T)
     return surface
 
+def edge_pixels(fractal, threshold=SUPERSAMPLE_THRESHOLD):
+    # Pixels whose escape value jumps by more than threshold to a horizontal
+    # or vertical neighbour, or which border the set
+    inside = fractal == 0
+    edges = np.zeros(fractal.shape, dtype=bool)
+    for axis in (0, 1):
+        jump = np.abs(np.diff(fractal, axis=axis)) > threshold
+        jump |= np.diff(inside, axis=axis)
+        if axis == 0:
+            edges[:-1] |= jump
+            edges[1:] |= jump
+        else:
+            edges[:, :-1] |= jump
+            edges[:, 1:] |= jump
+    return edges
+
 # Particle Systems
 class Particle:
     def __init__(self, x, y, size, color):
@@ -302,6 +1026,36 @@ class FractalGenerator:
         self.zoom = 2.5
         self.palette = generate_random_palette()
         self.julia_c = complex(-0.7, 0.27)
+        self.engine = "numpy"  # "numpy" (vectorized), "python" (per-pixel loops) or "perturbation" (deep zoom)
+        self.precision = "auto"  # "auto", "float32", "float64" or "extended"
+        self.last_precision = None  # Precision the last render actually used
+        # "single", "tiled" (process pool), "subdivide" (Mariani-Silver) or
+        # "cached" (tile cache); numpy engine only
+        self.render_mode = "single"
+        self.tile_cache = FractalTileCache()
+        self.last_fractal = None  # Raw escape-time array of the last render
+        self.iteration_state = None  # Per-pixel escape counts and unfinished orbits
+        self.smooth_colors = False  # Interpolate between palette entries
+        self.color_mode = "linear"  # "linear", "histogram" or "cdf"
+        self.last_histogram = None  # Band histogram merged while rendering, if any
+        self.reproject_refresh = REPROJECT_REFRESH  # Zoom frames between full recomputes
+        self.zoom_source = None  # Previous zoom-animation frame and its bounds
+        self.distance_shading = False  # Shade by boundary distance instead of escape time
+        self.last_distance = None  # Per-pixel boundary distance of the last distance render
+        self.workers = os.cpu_count() or 1
+        self.interior_checks = True  # Cardioid/bulb test and periodicity detection
+        self.last_stats = {}  # Counters from the last render, e.g. iterations_saved
+        self.cancel = None  # threading.Event that aborts the render in progress when set
+        
+    def snapshot(self):
+        # Shallow copy to render on another thread; the tile cache is shared
+        return copy.copy(self)
+        
+    def adopt_render(self, other):
+        # Take over the results of a render done on a snapshot
+        for name in ("last_fractal", "last_histogram", "last_stats", "last_precision",
+                     "last_distance", "iteration_state", "zoom_source"):
+            setattr(self, name, getattr(other, name))
         
     def update_params(self, x_center=None, y_center=None, zoom=None, max_iterations=None):
         if x_center is not None:
@@ -313,19 +1067,307 @@ class FractalGenerator:
         if max_iterations is not None:
             self.max_iterations = max_iterations
             
-    def generate(self, width, height):
+    def get_bounds(self, width, height):
         aspect_ratio = width / height
         x_min = self.x_center - self.zoom / 2
         x_max = self.x_center + self.zoom / 2
         y_min = self.y_center - self.zoom / (2 * aspect_ratio)
         y_max = self.y_center + self.zoom / (2 * aspect_ratio)
+        return x_min, x_max, y_min, y_max
+        
+    def select_precision(self, width):
+        # "float32", "float64" or "extended" (perturbation) for this view,
+        # chosen from the pixel spacing and iteration cap unless
+        # self.precision forces one
+        if self.precision != "auto":
+            return self.precision
+        if self.engine == "perturbation":
+            return "extended"
+        spacing = self.zoom / width
+        if spacing >= FLOAT32_MIN_SPACING and self.max_iterations <= FLOAT32_MAX_ITERATIONS:
+            return "float32"
+        if spacing >= FLOAT64_MIN_SPACING:
+            return "float64"
+        return "extended"
+        
+    def kernel_dtype(self, width):
+        return np.float32 if self.select_precision(width) == "float32" else np.float64
+        
+    def use_perturbation(self, width):
+        return self.select_precision(width) == "extended"
+        
+    def compute(self, width, height):
+        # Raw escape-time array for the current view
+        self.last_stats = {}
+        self.last_histogram = None
+        self.last_precision = self.select_precision(width)
+        if self.use_perturbation(width):
+            return compute_fractal_perturbation(self.type, height, width, self.max_iterations,
+                                                self.x_center, self.y_center, self.zoom, self.julia_c,
+                                                self.cancel)
+        
+        x_min, x_max, y_min, y_max = self.get_bounds(width, height)
+        bounds = (x_min, x_max, y_min, y_max)
+        dtype = self.kernel_dtype(width)
+        
+        if self.engine == "numpy" and self.render_mode == "tiled":
+            histograms = []
+            fractal = compute_fractal_tiled(self.type, height, width, self.max_iterations,
+                                            bounds, self.julia_c, workers=self.workers,
+                                            interior_checks=self.interior_checks, stats=self.last_stats,
+                                            histograms=histograms, dtype=dtype, cancel=self.cancel)
+            self.last_histogram = merge_histograms(histograms)
+            return fractal
+        
+        if self.engine == "numpy" and self.render_mode == "cached":
+            return compute_fractal_cached(self.type, height, width, self.max_iterations,
+                                          self.x_center, self.y_center, self.zoom, self.julia_c,
+                                          self.tile_cache, self.interior_checks, self.last_stats, dtype,
+                                          self.cancel)
+        
+        if self.engine == "numpy" and self.render_mode == "subdivide":
+            return compute_fractal_subdivided(self.type, height, width, self.max_iterations,
+                                              bounds, self.julia_c,
+                                              interior_checks=self.interior_checks, stats=self.last_stats,
+                                              dtype=dtype, cancel=self.cancel)
+        
+        if self.engine == "numpy":
+            return self.compute_resumable(width, height, bounds)
         
         if self.type == "mandelbrot":
-            fractal = compute_mandelbrot(height, width, self.max_iterations, x_min, x_max, y_min, y_max)
+            return compute_mandelbrot(height, width, self.max_iterations, x_min, x_max, y_min, y_max,
+                                      self.cancel)
         else:  # julia
-            fractal = compute_julia(height, width, self.max_iterations, x_min, x_max, y_min, y_max, self.julia_c)
-            
-        return color_fractal(fractal, self.palette)
+            return compute_julia(height, width, self.max_iterations, x_min, x_max, y_min, y_max,
+                                 self.julia_c, self.cancel)
+            
+    def resume_key(self, width, height, bounds):
+        return (self.type, self.julia_c, width, height, bounds, self.select_precision(width))
+        
+    def can_resume(self, width, height):
+        key = self.resume_key(width, height, self.get_bounds(width, height))
+        return self.iteration_state is not None and self.iteration_state["key"] == key
+        
+    def new_iteration_state(self, width, height, bounds):
+        # Resumable state for a view in which no pixel has been iterated yet
+        grid = pixel_grid(height, width, *bounds).ravel()
+        return {"key": self.resume_key(width, height, bounds), "grid": grid,
+                "result": np.zeros(grid.size), "counts": np.full(grid.size, -1),
+                "max_iterations": 0, "active": np.zeros(0, dtype=np.intp),
+                "z": np.zeros(0, dtype=np.complex128)}
+        
+    def start_orbits(self, state, indices):
+        # Starting z of the pixels at the flat indices. In-set points found
+        # by the interior checks are left out, they never need resuming.
+        c = state["grid"][indices]
+        if self.type == "mandelbrot" and self.interior_checks:
+            inside = in_cardioid_or_bulb(c)
+            count = int(inside.sum())
+            self.last_stats["cardioid_points"] = self.last_stats.get("cardioid_points", 0) + count
+            self.last_stats["iterations_saved"] = (self.last_stats.get("iterations_saved", 0) +
+                                                   count * self.max_iterations)
+            indices, c = indices[~inside], c[~inside]
+        if self.type == "mandelbrot":
+            return indices, np.zeros(indices.size, dtype=np.complex128)
+        return indices, c  # julia
+        
+    def continue_orbits(self, state, indices, z, start_iteration, width):
+        # Iterate the pixels at indices on from z and start_iteration up to
+        # max_iterations, storing their values and escape counts in state.
+        # Returns the pixels still iterating and their z.
+        c = state["grid"][indices] if self.type == "mandelbrot" else self.julia_c
+        orbit_state = {}
+        values = escape_time(z, c, self.max_iterations,
+                             periodicity_checks=self.interior_checks, stats=self.last_stats,
+                             start_iteration=start_iteration, state=orbit_state,
+                             dtype=self.kernel_dtype(width), cancel=self.cancel)
+        state["result"][indices] = values
+        state["counts"][indices] = orbit_state["counts"]
+        return indices[orbit_state["active"]], orbit_state["z"]
+        
+    def compute_resumable(self, width, height, bounds):
+        # Keeps the escape iteration of every pixel plus z for the pixels that
+        # were still iterating, so a new max_iterations for the same view is
+        # answered from the counts (lower) or by continuing those orbits (higher)
+        state = self.iteration_state
+        
+        if state is None or state["key"] != self.resume_key(width, height, bounds):
+            state = self.new_iteration_state(width, height, bounds)
+            state["active"], state["z"] = self.start_orbits(state, np.arange(width * height))
+            self.iteration_state = state
+            
+        if self.max_iterations > state["max_iterations"]:
+            # Continue the unfinished orbits from where they stopped
+            state["active"], state["z"] = self.continue_orbits(state, state["active"], state["z"],
+                                                               state["max_iterations"], width)
+            state["max_iterations"] = self.max_iterations
+            return state["result"].reshape(height, width).copy()
+        
+        # Lower limit: drop the escapes that happen at or after it
+        result = state["result"].copy()
+        result[state["counts"] >= self.max_iterations] = 0
+        return result.reshape(height, width)
+            
+    def color(self, fractal, histogram=None):
+        return color_fractal(fractal, self.palette, self.smooth_colors, self.color_mode, histogram)
+        
+    def render_bounds(self, width, height):
+        # Complex-plane bounds the last render's pixels were sampled on
+        if self.engine == "numpy" and self.render_mode == "cached":
+            gx0, gy0, spacing = snapped_origin(height, width, self.x_center, self.y_center, self.zoom)
+            return (gx0 * spacing, (gx0 + width) * spacing, gy0 * spacing, (gy0 + height) * spacing)
+        return self.get_bounds(width, height)
+        
+    def antialias(self, fractal, samples=SUPERSAMPLE_GRID, seed=0):
+        # Re-sample only the edge pixels on a jittered samples x samples
+        # sub-pixel grid and average their colors. All samples of all edge
+        # pixels go through the engine in one batch.
+        height, width = fractal.shape
+        surface = self.color(fractal, self.last_histogram)
+        if self.use_perturbation(width):
+            return surface
+        
+        rows, cols = np.nonzero(edge_pixels(fractal))
+        if rows.size == 0:
+            return surface
+        
+        rng = np.random.default_rng(seed)
+        grid = (np.arange(samples) + 0.5) / samples - 0.5
+        jitter = rng.uniform(-0.5, 0.5, (rows.size, samples * samples, 2)) / samples
+        offset_x = np.tile(grid, samples)[np.newaxis, :] + jitter[:, :, 0]
+        offset_y = np.repeat(grid, samples)[np.newaxis, :] + jitter[:, :, 1]
+        
+        x_min, x_max, y_min, y_max = self.render_bounds(width, height)
+        points = (x_min + ((cols[:, np.newaxis] + offset_x) / width) * (x_max - x_min) +
+                  1j * (y_min + ((rows[:, np.newaxis] + offset_y) / height) * (y_max - y_min)))
+        values = compute_fractal_points(self.type, self.max_iterations, points, self.julia_c,
+                                        self.interior_checks,
+                                        dtype=self.kernel_dtype(width)).reshape(points.shape)
+        
+        # Color the samples against the full frame's normalization
+        lut = palette_lut(tuple(self.palette), self.smooth_colors)
+        lut = np.vstack([lut, np.zeros((1, 3), dtype=np.uint8)]).astype(np.float64)
+        histogram = self.last_histogram
+        if self.color_mode != "linear" and histogram is None:
+            histogram = iteration_histogram(fractal)
+        index = palette_indices(values, self.palette, self.smooth_colors, self.color_mode,
+                                histogram, max_val=np.max(fractal))
+        colors = np.round(lut[index].mean(axis=1)).astype(np.uint8)
+        
+        pixels = pygame.surfarray.pixels3d(surface)
+        pixels[cols, rows] = colors
+        del pixels  # Unlock the surface
+        return surface
+        
+    def compute_zoom_frame(self, width, height):
+        # Next frame of a zoom animation: reproject the previous frame and
+        # recompute only the pixels it cannot answer, with a full render
+        # every reproject_refresh frames
+        bounds = self.get_bounds(width, height)
+        key = (self.type, self.julia_c, self.max_iterations, width, height, self.select_precision(width))
+        source = self.zoom_source
+        
+        if (source is None or source["key"] != key or self.use_perturbation(width) or
+                self.engine != "numpy" or source["frames"] >= self.reproject_refresh):
+            fractal = self.compute(width, height)
+            self.zoom_source = {"key": key, "fractal": fractal, "bounds": bounds, "frames": 0}
+            return fractal
+        
+        self.last_stats = {}
+        self.last_histogram = None
+        self.last_precision = self.select_precision(width)
+        fractal, recompute = reproject_fractal(source["fractal"], source["bounds"], bounds)
+        points = pixel_grid(height, width, *bounds)[recompute]
+        fractal[recompute] = compute_fractal_points(self.type, self.max_iterations, points, self.julia_c,
+                                                    self.interior_checks, self.last_stats,
+                                                    self.kernel_dtype(width), self.cancel)
+        self.last_stats["pixels_reused"] = int(recompute.size - recompute.sum())
+        self.zoom_source = {"key": key, "fractal": fractal, "bounds": bounds,
+                            "frames": source["frames"] + 1}
+        return fractal
+        
+    def generate_zoom_frame(self, width, height):
+        self.last_fractal = self.compute_zoom_frame(width, height)
+        return self.color(self.last_fractal, self.last_histogram)
+        
+    def render_julia_sweep(self, width, height, c_values, folder, batch_frames=JULIA_BATCH_FRAMES,
+                           workers=None):
+        # Render one Julia frame per c value to folder/frame_NNNN.png,
+        # yielding the file names in order
+        os.makedirs(folder, exist_ok=True)
+        return render_julia_sweep(folder, height, width, self.max_iterations, self.get_bounds(width, height),
+                                  np.asarray(c_values), self.palette, self.smooth_colors, self.color_mode,
+                                  self.interior_checks, batch_frames, workers or self.workers)
+        
+    def generate(self, width, height):
+        if self.distance_shading and not self.use_perturbation(width):
+            self.last_precision = "float64"
+            self.last_distance = compute_fractal_distance(self.type, height, width, self.max_iterations,
+                                                          self.get_bounds(width, height), self.julia_c,
+                                                          self.cancel)
+            return shade_distance(self.last_distance, self.palette)
+        
+        self.last_distance = None
+        self.last_fractal = self.compute(width, height)
+        return self.color(self.last_fractal, self.last_histogram)
+        
+    def recolor(self):
+        # Re-apply the palette to the last render without recomputing it
+        if self.last_distance is not None:
+            return shade_distance(self.last_distance, self.palette)
+        return self.color(self.last_fractal, self.last_histogram)
+        
+    def generate_progressive(self, width, height, steps=PROGRESSIVE_STEPS):
+        # Yields a surface per pass, from a coarse preview to full resolution.
+        # Every pass samples the pixels on its stride and skips the ones an
+        # earlier pass already computed, so each pixel is iterated once. The
+        # passes fill a resumable state, which the last one keeps.
+        # Only max_iterations changed: resuming is cheaper than any preview.
+        if (self.engine != "numpy" or self.render_mode != "single" or self.use_perturbation(width) or
+                self.distance_shading or self.can_resume(width, height)):
+            yield self.generate(width, height)
+            return
+        
+        self.last_stats = {}
+        self.last_histogram = None
+        self.last_precision = self.select_precision(width)
+        state = self.new_iteration_state(width, height, self.get_bounds(width, height))
+        active, active_z = [], []
+        fractal = np.zeros((height, width))
+        computed = np.zeros((height, width), dtype=bool)
+        histogram = None
+        
+        for step in steps:
+            rows = np.arange(0, height, step)
+            cols = np.arange(0, width, step)
+            block = np.ix_(rows, cols)
+            
+            todo = ~computed[block]
+            indices = (rows[:, np.newaxis] * width + cols[np.newaxis, :])[todo]
+            started, z = self.start_orbits(state, indices)
+            started, z = self.continue_orbits(state, started, z, 0, width)
+            active.append(started)
+            active_z.append(z)
+            values = fractal[block]
+            new_values = state["result"][indices]
+            values[todo] = new_values
+            fractal[block] = values
+            computed[block] = True
+            
+            # The running histogram only grows by the newly computed pixels
+            histogram = merge_histograms([histogram, iteration_histogram(new_values)])
+            if step == 1:
+                state["active"], state["z"] = np.concatenate(active), np.concatenate(active_z)
+                state["max_iterations"] = self.max_iterations
+                self.iteration_state = state
+                self.last_fractal = fractal
+                self.last_histogram = histogram
+            
+            # Color only the sampled pixels and stretch them over the canvas
+            surface = self.color(values, histogram)
+            if step > 1:
+                surface = pygame.transform.scale(surface, (width, height))
+            yield surface
 
 class ParticleGenerator:
     def __init__(self):
@@ -438,25 +1480,125 @@ class Slider:
             # Update value based on mouse position
             pos_ratio = (event.pos[0] - self.rect.x) / self.rect.width
             pos_ratio = max(0, min(1, pos_ratio))
+            old_value = self.value
             self.value = self.min_val + pos_ratio * (self.max_val - self.min_val)
             
             # Round to integer if needed
             if isinstance(self.min_val, int) and isinstance(self.max_val, int):
                 self.value = round(self.value)
+            return self.value != old_value
+        
+        return False
+
+# Background rendering
+class RenderWorker:
+    # Renders fractal jobs on a daemon thread so the pygame loop keeps
+    # painting. Every job works on a snapshot of the FractalGenerator taken
+    # when it was submitted, and its passes come back through the results
+    # queue for the main loop to pick up with poll().
+    #
+    # Only the newest request is kept: a submit replaces the request still
+    # waiting to start and cancels the running job, which stops at its next
+    # iteration, row or tile check. Dragging a slider therefore renders the
+    # latest parameters instead of queueing a render per mouse event.
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.request = None  # Newest job waiting to start
+        self.cancel = None  # Cancel event of the running job
+        self.running = False
+        self.results = queue.Queue()
+        self.latest_job = 0
+        self.dropped = 0  # Requests replaced before they started
+        self.cancelled = 0  # Jobs aborted part way through
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        
+    def submit(self, generator, width, height, progressive=True):
+        generator = generator.snapshot()
+        generator.cancel = threading.Event()
+        with self.condition:
+            self.latest_job += 1
+            if self.request is not None:
+                self.dropped += 1
+            self.request = (self.latest_job, generator, width, height, progressive)
+            if self.cancel is not None:
+                self.cancel.set()
+            self.condition.notify_all()
+        
+    def discard(self):
+        # Drop the waiting request, cancel the running job and ignore the
+        # results of every job submitted so far
+        with self.condition:
+            self.latest_job += 1
+            self.request = None
+            if self.cancel is not None:
+                self.cancel.set()
+        
+    def busy(self):
+        with self.condition:
+            return self.request is not None or self.running
+        
+    def wait(self):
+        # Block until the worker has nothing left to render
+        with self.condition:
+            self.condition.wait_for(lambda: self.request is None and not self.running)
+        
+    def run(self):
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.request is not None)
+                job, generator, width, height, progressive = self.request
+                self.request = None
+                self.cancel = generator.cancel
+                self.running = True
+            try:
+                if progressive:
+                    for surface in generator.generate_progressive(width, height):
+                        self.results.put((job, generator, surface, False))
+                else:
+                    self.results.put((job, generator, generator.generate(width, height), False))
+            except RenderCancelled:
+                self.cancelled += 1
+            except Exception as e:
+                print(f"Error rendering fractal: {e}")
+            self.results.put((job, generator, None, True))
+            with self.condition:
+                self.cancel = None
+                self.running = False
+                self.condition.notify_all()
+            
+    def poll(self):
+        # (generator, surface, finished) updates of the latest job published
+        # since the last call; surface is None on the finishing update
+        updates = []
+        while True:
+            try:
+                job, generator, surface, finished = self.results.get_nowait()
+            except queue.Empty:
+                return updates
+            if job == self.latest_job:
+                updates.append((generator, surface, finished))
 
 # Application
 class GenerativeArtStudio:
     def __init__(self):
+        init_display()
         self.running = True
         self.generator_mode = "fractal"
         self.animation_frames = []
         self.recording = False
         self.frame_count = 0
+        self.julia_sweep = None  # (c, frame file) pairs of a Julia recording
+        self.julia_sweep_folder = None
         
         # Create generators
         self.fractal_gen = FractalGenerator()
         self.particle_gen = ParticleGenerator()
         
+        # Fractals render in the background; the last good frame stays up
+        self.render_worker = RenderWorker()
+        self.art_surface = pygame.Surface((WIDTH, HEIGHT))
+        
         # Create UI elements
         self.setup_ui()
         
@@ -544,13 +1686,52 @@ class GenerativeArtStudio:
         
         y_offset += 60
         
+        self.interior_btn = Button(WIDTH + 20, y_offset, 250, 30, self.interior_checks_label())
+        self.fractal_controls.append(self.interior_btn)
+        
+        y_offset += 40
+        
+        self.color_mode_btn = Button(WIDTH + 20, y_offset, 250, 30, self.color_mode_label())
+        self.fractal_controls.append(self.color_mode_btn)
+        
+        y_offset += 40
+        
+        self.distance_btn = Button(WIDTH + 20, y_offset, 250, 30, self.distance_shading_label())
+        self.fractal_controls.append(self.distance_btn)
+        
+        y_offset += 40
+        
+        self.precision_btn = Button(WIDTH + 20, y_offset, 250, 30, self.precision_label())
+        self.fractal_controls.append(self.precision_btn)
+        
+        y_offset += 40
+        
         # Add active controls to UI elements
         if self.generator_mode == "fractal":
             self.ui_elements.extend(self.fractal_controls)
         else:
             self.ui_elements.extend(self.particle_controls)
             
-    def regenerate_art(self):
+    def interior_checks_label(self):
+        return "Interior Checks: " + ("On" if self.fractal_gen.interior_checks else "Off")
+            
+    def distance_shading_label(self):
+        return "Distance Shading: " + ("On" if self.fractal_gen.distance_shading else "Off")
+            
+    def precision_label(self):
+        # Shows what "Auto" picked for the last render
+        names = {"float32": "Float32", "float64": "Float64", "extended": "Extended"}
+        precision = self.fractal_gen.precision
+        used = self.fractal_gen.last_precision
+        if precision != "auto":
+            return "Precision: " + names[precision]
+        return "Precision: Auto" + (f" ({names[used]})" if used else "")
+            
+    def color_mode_label(self):
+        return "Coloring: " + {"linear": "Linear", "histogram": "Histogram",
+                               "cdf": "Smooth CDF"}[self.fractal_gen.color_mode]
+            
+    def regenerate_art(self, progressive=True):
         if self.generator_mode == "fractal":
             # Update fractal parameters
             self.fractal_gen.max_iterations = self.iter_slider.value
@@ -561,15 +1742,49 @@ class GenerativeArtStudio:
                 if hasattr(self, 'julia_real_slider') and hasattr(self, 'julia_imag_slider'):
                     self.fractal_gen.julia_c = complex(self.julia_real_slider.value, self.julia_imag_slider.value)
                 
-            # Generate new fractal
-            self.art_surface = self.fractal_gen.generate(WIDTH, HEIGHT)
-            self.preview_surface = pygame.transform.scale(self.art_surface, (PREVIEW_WIDTH, PREVIEW_HEIGHT))
+            # Generate new fractal on the render worker, which publishes a
+            # coarse pass first and refines it. Non-progressive renders are
+            # for callers that need the frame right away.
+            if progressive:
+                self.render_worker.submit(self.fractal_gen, WIDTH, HEIGHT)
+            else:
+                self.stop_render_worker()
+                self.art_surface = self.fractal_gen.generate(WIDTH, HEIGHT)
+                self.preview_surface = pygame.transform.scale(self.art_surface, (PREVIEW_WIDTH, PREVIEW_HEIGHT))
         else:
             # Update particle parameters
             if self.particle_gen.num_particles != self.particles_slider.value:
                 self.particle_gen.num_particles = self.particles_slider.value
                 self.particle_gen.system = ParticleSystem(self.particle_gen.num_particles, self.particle_gen.palette)
     
+    def stop_render_worker(self):
+        # Cancel background renders and drop their queued passes before
+        # rendering on the main thread, so no stale frame or state comes back
+        self.render_worker.discard()
+        self.render_worker.wait()
+        self.render_worker.poll()
+    
+    def recolor_art(self):
+        # Only the coloring changed, so reuse the computed iterations. A job
+        # that already finished may still have its last pass queued.
+        busy = self.render_worker.busy()
+        self.poll_render()
+        if busy or self.fractal_gen.last_fractal is None:
+            self.regenerate_art()
+            return
+        self.art_surface = self.fractal_gen.recolor()
+        self.preview_surface = pygame.transform.scale(self.art_surface, (PREVIEW_WIDTH, PREVIEW_HEIGHT))
+    
+    def poll_render(self):
+        # Show the newest pass from the render worker; the last one also
+        # hands the computed iterations over to fractal_gen
+        for generator, surface, finished in self.render_worker.poll():
+            if surface is not None:
+                self.art_surface = surface
+                self.preview_surface = pygame.transform.scale(self.art_surface, (PREVIEW_WIDTH, PREVIEW_HEIGHT))
+            if finished:
+                self.fractal_gen.adopt_render(generator)
+    
     def run(self):
         clock = pygame.time.Clock()
         
@@ -586,7 +1801,10 @@ class GenerativeArtStudio:
                 # Handle UI events
                 for element in self.ui_elements:
                     if isinstance(element, Slider):
-                        element.handle_event(event)
+                        # Fractal sliders re-render while dragging; the render
+                        # worker coalesces the requests to the latest value
+                        if element.handle_event(event) and element in self.fractal_controls:
+                            self.regenerate_art()
                     elif isinstance(element, (Button, RadioButton)):
                         if element.is_clicked(event):
                             self.handle_ui_click(element)
@@ -596,8 +1814,17 @@ class GenerativeArtStudio:
             
             # Update and draw art
             if self.generator_mode == "fractal":
-                # Draw precomputed fractal
+                # Pick up finished passes, then draw the latest one
+                self.poll_render()
                 screen.blit(self.art_surface, (0, 0))
+                
+                # The last good frame stays up while the worker renders
+                if self.render_worker.busy():
+                    text = font_medium.render("Rendering...", True, UI_TEXT_COLOR)
+                    backdrop = pygame.Surface((text.get_width() + 20, text.get_height() + 10), pygame.SRCALPHA)
+                    backdrop.fill((0, 0, 0, 160))
+                    screen.blit(backdrop, (10, 10))
+                    screen.blit(text, (20, 15))
             else:
                 # Update particle system
                 self.particle_gen.update()
@@ -618,36 +1845,45 @@ class GenerativeArtStudio:
                         # For fractals, modify parameters slightly for animation
                         if self.fractal_gen.type == "mandelbrot":
                             self.fractal_gen.zoom *= 0.98  # Zoom in
+                            
+                            # Reuse the previous frame's iterations where possible
+                            self.stop_render_worker()
+                            self.art_surface = self.fractal_gen.generate_zoom_frame(WIDTH, HEIGHT)
+                            self.preview_surface = pygame.transform.scale(self.art_surface, (PREVIEW_WIDTH, PREVIEW_HEIGHT))
                         else:  # julia
-                            # Rotate Julia parameter
-                            angle = 0.05
-                            c = self.fractal_gen.julia_c
-                            real = c.real * math.cos(angle) - c.imag * math.sin(angle)
-                            imag = c.real * math.sin(angle) + c.imag * math.cos(angle)
-                            self.fractal_gen.julia_c = complex(real, imag)
+                            # Rotate Julia parameter; the frames come from one
+                            # batched sweep over the rotated values
+                            if self.julia_sweep is None:
+                                self.start_julia_sweep(60 - len(self.animation_frames))
+                            c, filename = next(self.julia_sweep)
+                            self.fractal_gen.julia_c = complex(c)
                             
                             # Update sliders to reflect new value
                             if hasattr(self, 'julia_real_slider'):
-                                self.julia_real_slider.value = real
+                                self.julia_real_slider.value = c.real
                             if hasattr(self, 'julia_imag_slider'):
-                                self.julia_imag_slider.value = imag
+                                self.julia_imag_slider.value = c.imag
                         
-                        self.regenerate_art()
+                            self.art_surface = pygame.image.load(filename)
+                            self.preview_surface = pygame.transform.scale(self.art_surface, (PREVIEW_WIDTH, PREVIEW_HEIGHT))
                     
-                    # Save frame to list
-                    self.animation_frames.append(canvas.copy())
+                    # Save frame to list; fractal frames are in art_surface,
+                    # canvas only holds the particles
+                    if self.generator_mode == "fractal":
+                        self.animation_frames.append(self.art_surface.copy())
+                    else:
+                        self.animation_frames.append(canvas.copy())
                     
                     # If we've collected enough frames, stop recording
                     if len(self.animation_frames) >= 60:
-                        self.save_animation()
-                        self.recording = False
-                        self.record_btn.color = UI_BUTTON_COLOR
-                        self.record_btn.text = "Record Animation"
+                        self.stop_recording()
             
             # Update display
             pygame.display.flip()
             clock.tick(60)
             
+        if self.julia_sweep is not None:
+            self.stop_julia_sweep()
         pygame.quit()
         
     def draw_ui(self):
@@ -675,9 +1911,16 @@ class GenerativeArtStudio:
         screen.blit(mode_label, (WIDTH + 20, 65))
         
         # Draw UI elements
+        self.precision_btn.text = self.precision_label()
         for element in self.ui_elements:
             element.draw(screen)
             
+        # Report the work skipped by the interior checks
+        if self.generator_mode == "fractal" and self.fractal_gen.interior_checks:
+            saved = self.fractal_gen.last_stats.get("iterations_saved", 0)
+            stats_text = font_small.render(f"Iterations saved: {saved:,}", True, UI_TEXT_COLOR)
+            screen.blit(stats_text, (WIDTH + 20, self.precision_btn.rect.bottom + 5))
+            
         # Draw recording indicator if active
         if self.recording:
             record_text = font_medium.render(f"Recording... Frame {len(self.animation_frames)}/60", 
@@ -751,6 +1994,27 @@ class GenerativeArtStudio:
                 
             self.regenerate_art()
             
+        elif element == self.interior_btn:
+            self.fractal_gen.interior_checks = not self.fractal_gen.interior_checks
+            self.interior_btn.text = self.interior_checks_label()
+            self.regenerate_art()
+            
+        elif element == self.color_mode_btn:
+            modes = ["linear", "histogram", "cdf"]
+            self.fractal_gen.color_mode = modes[(modes.index(self.fractal_gen.color_mode) + 1) % len(modes)]
+            self.color_mode_btn.text = self.color_mode_label()
+            self.recolor_art()
+            
+        elif element == self.distance_btn:
+            self.fractal_gen.distance_shading = not self.fractal_gen.distance_shading
+            self.distance_btn.text = self.distance_shading_label()
+            self.regenerate_art()
+            
+        elif element == self.precision_btn:
+            modes = ["auto", "float32", "float64", "extended"]
+            self.fractal_gen.precision = modes[(modes.index(self.fractal_gen.precision) + 1) % len(modes)]
+            self.regenerate_art()
+            
         # Particle controls
         elif element == self.debug_btn:
             self.particle_gen.show_debug = not self.particle_gen.show_debug
@@ -790,7 +2054,7 @@ class GenerativeArtStudio:
             
             if self.generator_mode == "fractal":
                 self.fractal_gen.palette = new_palette
-                self.regenerate_art()
+                self.recolor_art()
             else:
                 self.particle_gen.palette = new_palette
                 self.particle_gen.system = ParticleSystem(
@@ -809,10 +2073,32 @@ class GenerativeArtStudio:
                 self.record_btn.color = (200, 60, 60)
                 self.record_btn.text = "Recording..."
             else:
-                self.save_animation()
-                self.recording = False
-                self.record_btn.color = UI_BUTTON_COLOR
-                self.record_btn.text = "Record Animation"
+                self.stop_recording()
+    
+    def stop_recording(self):
+        self.save_animation()
+        self.recording = False
+        self.record_btn.color = UI_BUTTON_COLOR
+        self.record_btn.text = "Record Animation"
+        if self.julia_sweep is not None:
+            self.stop_julia_sweep()
+            # The sweep bypassed fractal_gen, so render the final c properly
+            self.regenerate_art()
+    
+    def start_julia_sweep(self, frames):
+        # Render the recording's Julia frames in batches, on the render pool
+        # when there are several cores, into a scratch folder
+        self.stop_render_worker()
+        c_values = julia_rotation_values(self.fractal_gen.julia_c, frames)
+        self.julia_sweep_folder = tempfile.mkdtemp(prefix="julia_sweep_")
+        filenames = self.fractal_gen.render_julia_sweep(WIDTH, HEIGHT, c_values, self.julia_sweep_folder)
+        self.julia_sweep = zip(c_values, filenames)
+    
+    def stop_julia_sweep(self):
+        # Frames rendered ahead of an early stop go with the scratch folder
+        shutil.rmtree(self.julia_sweep_folder, ignore_errors=True)
+        self.julia_sweep = None
+        self.julia_sweep_folder = None
     
     def save_image(self):
         # Create output directory if it doesn't exist
@@ -828,7 +2114,14 @@ class GenerativeArtStudio:
             filename = f"output/art_{mode}_{subtype}_{timestamp}.png"
             
             if self.generator_mode == "fractal":
-                pygame.image.save(self.art_surface, filename)
+                # Exports get edge-only supersampling once the render is final
+                busy = self.render_worker.busy()
+                self.poll_render()
+                if (not busy and self.fractal_gen.last_fractal is not None and
+                        self.fractal_gen.last_distance is None):
+                    pygame.image.save(self.fractal_gen.antialias(self.fractal_gen.last_fractal), filename)
+                else:
+                    pygame.image.save(self.art_surface, filename)
             else:
                 pygame.image.save(canvas, filename)
             
@@ -881,11 +2174,19 @@ class GenerativeArtStudio:
             pygame.time.set_timer(pygame.USEREVENT, 2000)  # Reset text after 2 seconds
 
 # Additional fractal types
+def _render_flame_share(generator, samples, seed):
+    # Runs in a worker process: one seeded chaos game into a private histogram
+    histogram = np.zeros((generator.height, generator.width, 3), dtype=np.float32)
+    return generator.chaos_game(samples, np.random.default_rng(seed), histogram)
+
 class FlameGenerator:
     def __init__(self, width, height):
         self.width = width
         self.height = height
-        self.histogram = np.zeros((height, width, 3), dtype=np.float64)
+        self.histogram = np.zeros((height, width, 3), dtype=np.float32)
+        self.workers = os.cpu_count() or 1
+        # With a seed the same number of workers renders the same image
+        self.seed = None
         self.num_functions = random.randint(3, 7)
         self.functions = []
         self.palette = generate_random_palette()
@@ -915,104 +2216,139 @@ class FlameGenerator:
             f['weight'] /= total_weight
             
     def apply_variation(self, x, y, variation_type):
-        r = math.sqrt(x*x + y*y)
-        theta = math.atan2(y, x)
+        # Works on whole arrays of walker positions
+        r2 = x*x + y*y
         
         if variation_type == 'linear':
             return x, y
         elif variation_type == 'sinusoidal':
-            return math.sin(x), math.sin(y)
+            return np.sin(x), np.sin(y)
         elif variation_type == 'spherical':
-            if r != 0:
-                return x/r**2, y/r**2
-            return 0, 0
+            inverse = np.divide(1.0, r2, out=np.zeros_like(r2), where=r2 != 0)
+            return x * inverse, y * inverse
         elif variation_type == 'swirl':
-            return x*math.sin(r**2) - y*math.cos(r**2), x*math.cos(r**2) + y*math.sin(r**2)
+            sin_r2, cos_r2 = np.sin(r2), np.cos(r2)
+            return x*sin_r2 - y*cos_r2, x*cos_r2 + y*sin_r2
         
         return x, y  # Default
     
-    def generate(self, iterations=5000000, final_iterations=20):
-        # Reset histogram
-        self.histogram = np.zeros((self.height, self.width, 3), dtype=np.float64)
-        
-        # Initial point
-        x, y = 0, 0
+    def function_arrays(self):
+        # The functions as arrays indexed by function number: affine
+        # coefficients, a lookup table that turns a uniform random index into
+        # a weighted choice, variation ids into the variation name list and
+        # RGB weights
+        coefficients = {key: np.array([f[key] for f in self.functions], dtype=np.float32)
+                        for key in 'abcdef'}
+        cumulative = np.cumsum([f['weight'] for f in self.functions])
+        edges = np.round(cumulative / cumulative[-1] * FLAME_CHOICE_TABLE).astype(np.intp)
+        choices = np.repeat(np.arange(len(self.functions)), np.diff(edges, prepend=0))
+        names = sorted({f['variation'] for f in self.functions})
+        variations = np.array([names.index(f['variation']) for f in self.functions])
+        colors = np.array([self.palette[int(f['color'] * (len(self.palette) - 1))]
+                           for f in self.functions], dtype=np.float32) / 255.0
+        return coefficients, choices, (variations, names), colors
+    
+    def chaos_game(self, samples, rng, histogram, walkers=FLAME_WALKERS):
+        # Advance independent walkers together, each step picking a function
+        # per walker, and add every plotted sample's color to histogram
+        coefficients, choices, (variations, names), colors = self.function_arrays()
+        a, b, c, d, e, f = (coefficients[key] for key in 'abcdef')
+        walkers = max(1, min(walkers, samples))
+        x = rng.uniform(-1, 1, walkers).astype(np.float32)
+        y = rng.uniform(-1, 1, walkers).astype(np.float32)
+        flat = histogram.reshape(-1, 3)
+        
+        def step(x, y):
+            # Weighted choice of a function, then affine transform and variation
+            chosen = choices[(rng.random(len(x), dtype=np.float32) * len(choices)).astype(np.intp)]
+            new_x = a[chosen] * x + b[chosen] * y + e[chosen]
+            new_y = c[chosen] * x + d[chosen] * y + f[chosen]
+            kinds = variations[chosen]
+            for kind, variation in enumerate(names):
+                mask = kinds == kind
+                if variation != 'linear' and mask.any():
+                    new_x[mask], new_y[mask] = self.apply_variation(new_x[mask], new_y[mask], variation)
+            # Walkers that blew up start over from a random point
+            lost = ~(np.isfinite(new_x) & np.isfinite(new_y))
+            if lost.any():
+                new_x[lost] = rng.uniform(-1, 1, lost.sum())
+                new_y[lost] = rng.uniform(-1, 1, lost.sum())
+            return new_x, new_y, chosen, lost
         
         # Skip the first iterations to let the attractor converge
-        for _ in range(20):
-            # Choose a function based on weights
-            r = random.random()
-            cumulative_weight = 0
-            chosen_f = None
-            
-            for f in self.functions:
-                cumulative_weight += f['weight']
-                if r <= cumulative_weight:
-                    chosen_f = f
-                    break
-            
-            # Apply affine transform
-            new_x = chosen_f['a'] * x + chosen_f['b'] * y + chosen_f['e']
-            new_y = chosen_f['c'] * x + chosen_f['d'] * y + chosen_f['f']
-            
-            # Apply variation
-            x, y = self.apply_variation(new_x, new_y, chosen_f['variation'])
-        
-        # Main iterations
-        for i in range(iterations):
-            # Choose a function based on weights
-            r = random.random()
-            cumulative_weight = 0
-            chosen_f = None
-            
-            for f in self.functions:
-                cumulative_weight += f['weight']
-                if r <= cumulative_weight:
-                    chosen_f = f
-                    break
-            
-            # Apply affine transform
-            new_x = chosen_f['a'] * x + chosen_f['b'] * y + chosen_f['e']
-            new_y = chosen_f['c'] * x + chosen_f['d'] * y + chosen_f['f']
-            
-            # Apply variation
-            x, y = self.apply_variation(new_x, new_y, chosen_f['variation'])
-            
-            # Map to screen coordinates
-            screen_x = int((x + 2) * self.width / 4)
-            screen_y = int((y + 2) * self.height / 4)
-            
-            # Check if point is in bounds
-            if 0 <= screen_x < self.width and 0 <= screen_y < self.height:
-                # Update histogram with color
-                color_idx = int(chosen_f['color'] * (len(self.palette) - 1))
-                r, g, b = self.palette[color_idx]
-                
-                self.histogram[screen_y, screen_x, 0] += r / 255.0
-                self.histogram[screen_y, screen_x, 1] += g / 255.0
-                self.histogram[screen_y, screen_x, 2] += b / 255.0
+        for _ in range(FLAME_WARMUP_STEPS):
+            x, y, _, _ = step(x, y)
+        
+        def flush(hits):
+            # Hits per pixel and function, then one color sum per pixel
+            counts = np.bincount(np.concatenate(hits), minlength=len(flat) * len(colors))
+            flat[:] += counts.reshape(len(flat), len(colors)) @ colors
+        
+        # Hits are indexed pixel * functions + function and binned in batches
+        # of about one per bin, so binning costs no more than the samples
+        hits, pending = [], 0
+        remaining = samples
+        while remaining > 0:
+            x, y, chosen, lost = step(x, y)
+            count = min(remaining, walkers)
+            remaining -= count
+            
+            # Map to screen coordinates, truncating toward zero like int()
+            screen_x = ((x[:count] + 2) * self.width / 4).astype(np.int64)
+            screen_y = ((y[:count] + 2) * self.height / 4).astype(np.int64)
+            inside = ((screen_x >= 0) & (screen_x < self.width) &
+                      (screen_y >= 0) & (screen_y < self.height) & ~lost[:count])
+            pixel = screen_y[inside] * self.width + screen_x[inside]
+            hits.append(pixel * len(colors) + chosen[:count][inside])
+            pending += len(pixel)
+            if pending >= len(flat) * len(colors):
+                flush(hits)
+                hits, pending = [], 0
+        if hits:
+            flush(hits)
+        return histogram
+    
+    def render_histogram(self, iterations):
+        # Every worker plays its own chaos game over an even share of the
+        # samples, seeded from the seed sequence, into a float32 histogram;
+        # the histograms are summed in worker order, so a fixed seed and
+        # worker count reproduce the result exactly
+        seed = self.seed if self.seed is not None else random.getrandbits(64)
+        workers = max(1, min(self.workers, iterations))
+        seeds = np.random.SeedSequence(seed).spawn(workers)
+        shares = [iterations // workers + (i < iterations % workers) for i in range(workers)]
+        
+        if workers == 1:
+            return _render_flame_share(self, shares[0], seeds[0])
+        
+        # Workers only need the functions, not the last histogram
+        generator = copy.copy(self)
+        generator.histogram = None
+        pool = get_render_pool(workers)
+        futures = [pool.submit(_render_flame_share, generator, share, share_seed)
+                   for share, share_seed in zip(shares, seeds)]
+        histogram = futures[0].result()
+        for future in futures[1:]:
+            histogram += future.result()
+        return histogram
+    
+    def generate(self, iterations=5000000, final_iterations=20):
+        self.histogram = self.render_histogram(iterations)
         
         # Final rendering passes
         for _ in range(final_iterations):
             self.apply_gamma_correction()
             self.apply_log_density()
         
-        # Create Pygame surface
-        surface = pygame.Surface((self.width, self.height))
-        
         # Normalize histogram
         max_value = np.max(self.histogram)
         if max_value > 0:
             self.histogram = self.histogram / max_value
             
         # Map to surface
-        for y in range(self.height):
-            for x in range(self.width):
-                r = int(min(255, self.histogram[y, x, 0] * 255))
-                g = int(min(255, self.histogram[y, x, 1] * 255))
-                b = int(min(255, self.histogram[y, x, 2] * 255))
-                surface.set_at((x, y), (r, g, b))
-                
+        rgb = np.minimum(255, self.histogram * 255).astype(np.uint8)
+        surface = pygame.Surface((self.width, self.height))
+        pygame.surfarray.blit_array(surface, rgb.swapaxes(0, 1))
         return surface
     
     def apply_gamma_correction(self, gamma=2.2):
@@ -3,17 +3,71 @@
 import numpy as np
 from PIL import Image
 import multiprocessing
-from numba import njit, prange
+import threading
+from functools import lru_cache
+from numba import njit, prange, get_num_threads
 
-@njit(parallel=True)
-def compute_mandelbrot(width, height, zoom, max_iter, center):
-    image = np.zeros((height, width, 3), dtype=np.uint8)
+# Explicit kernel signatures. The wrappers below always call with these
+# types, so each kernel is compiled once and then loaded from numba's on-disk
+# cache (__pycache__) by every later process, render workers included.
+MANDELBROT_SIGNATURE = "void(float32[:, ::1], float64, int64, UniTuple(float64, 2))"
+JULIA_SIGNATURE = "void(float32[:, ::1], float64, int64, complex128, UniTuple(float64, 2))"
+PALETTE_SIGNATURE = "void(float32[:, ::1], int64, uint8[:, ::1], uint8[:, :, ::1])"
+
+PALETTE_STEPS = 1024  # Colors in the gradient a palette is stretched into
+INSIDE = -1.0  # Smooth value stored for points that never escape
+
+def hue_palette():
+    # The full-saturation hue wheel the kernels used to write as HSV, converted
+    # to RGB once (256 entries) so it can be used like any other palette
+    hsv = np.full((1, 256, 3), 255, dtype=np.uint8)
+    hsv[0, :, 0] = np.arange(256)
+    return [tuple(int(v) for v in color)
+            for color in np.asarray(Image.fromarray(hsv, 'HSV').convert('RGB'))[0]]
+
+HUE_PALETTE = hue_palette()
+
+@lru_cache(maxsize=32)
+def palette_gradient(palette, steps=PALETTE_STEPS):
+    # Lookup table blending evenly between the palette's colors; cached per
+    # palette (a tuple of RGB tuples), so recoloring reuses it
+    colors = np.array(palette, dtype=np.float64)
+    positions = np.linspace(0, len(colors) - 1, steps)
+    lut = np.empty((steps, 3), dtype=np.uint8)
+    for channel in range(3):
+        lut[:, channel] = np.round(np.interp(positions, np.arange(len(colors)), colors[:, channel]))
+    return lut
+
+def reuse_buffer(shape, dtype, out=None):
+    # C-contiguous buffer of the given shape. The memory behind out is reused
+    # whenever it is large enough, so a resized window only allocates when it
+    # grows past every earlier size.
+    size = int(np.prod(shape))
+    storage = None
+    if out is not None and out.dtype == dtype:
+        storage = out if out.base is None else out.base
+    if storage is None or storage.size < size:
+        storage = np.empty(size, dtype=dtype)
+    return storage.reshape(-1)[:size].reshape(shape)
+
+def image_buffer(width, height, out=None):
+    # RGB buffer laid out the way pygame.image.frombuffer expects
+    return reuse_buffer((height, width, 3), np.uint8, out)
+
+def values_buffer(width, height, out=None):
+    # Smooth iteration counts, one float32 per pixel
+    return reuse_buffer((height, width), np.float32, out)
+
+@njit(parallel=True, cache=True)
+def compute_mandelbrot(values, zoom, max_iter, center):
+    height, width = values.shape[0], values.shape[1]
     x_center, y_center = center
     x_width = 1.5
     y_height = 1.5 * height / width
+    log2 = np.log(2.0)
 
     for y in prange(height):
-        for x in prange(width):
+        for x in range(width):
             a = x_center + (x - width / 2) * x_width / (0.5 * zoom * width)
             b = y_center + (y - height / 2) * y_height / (0.5 * zoom * height)
             c = complex(a, b)
@@ -24,26 +78,29 @@ def compute_mandelbrot(width, height, zoom, max_iter, center):
                 z = z * z + c
                 n += 1
 
-            hue = int(255 * n / max_iter)
-            saturation = 255
-            value = 255 if n < max_iter else 0
-            image[y, x] = (hue, saturation, value)
-    return image
+            if n < max_iter:
+                # Continuous (log-log) escape count instead of the integer n
+                log_z = 0.5 * np.log(z.real * z.real + z.imag * z.imag)
+                values[y, x] = max(0.0, n + 1 - np.log(log_z) / log2)
+            else:
+                values[y, x] = INSIDE
 
-def mandelbrot(width, height, zoom, max_iter, center=(0, 0)):
-    image_array = compute_mandelbrot(width, height, zoom, max_iter, center)
-    img = Image.fromarray(image_array, 'HSV').convert('RGB')
-    return img
+def mandelbrot_values(width, height, zoom, max_iter, center=(0, 0), out=None):
+    # Fills out (allocated when missing or too small) and returns it
+    values = values_buffer(width, height, out)
+    compute_mandelbrot(values, float(zoom), int(max_iter), (float(center[0]), float(center[1])))
+    return values
 
-@njit(parallel=True)
-def compute_julia(width, height, zoom, max_iter, c_complex, center):
-    image = np.zeros((height, width, 3), dtype=np.uint8)
+@njit(parallel=True, cache=True)
+def compute_julia(values, zoom, max_iter, c_complex, center):
+    height, width = values.shape[0], values.shape[1]
     x_center, y_center = center
     x_width = 1.5
     y_height = 1.5 * height / width
+    log2 = np.log(2.0)
 
     for y in prange(height):
-        for x in prange(width):
+        for x in range(width):
             a = x_center + (x - width / 2) * x_width / (0.5 * zoom * width)
             b = y_center + (y - height / 2) * y_height / (0.5 * zoom * height)
             z = complex(a, b)
@@ -53,13 +110,65 @@ def compute_julia(width, height, zoom, max_iter, c_complex, center):
                 z = z * z + c_complex
                 n += 1
 
-            hue = int(255 * n / max_iter)
-            saturation = 255
-            value = 255 if n < max_iter else 0
-            image[y, x] = (hue, saturation, value)
+            if n < max_iter:
+                log_z = 0.5 * np.log(z.real * z.real + z.imag * z.imag)
+                values[y, x] = max(0.0, n + 1 - np.log(log_z) / log2)
+            else:
+                values[y, x] = INSIDE
+
+def julia_values(width, height, zoom, max_iter, c_complex, center=(0, 0), out=None):
+    values = values_buffer(width, height, out)
+    compute_julia(values, float(zoom), int(max_iter), complex(c_complex),
+                  (float(center[0]), float(center[1])))
+    return values
+
+@njit(parallel=True, cache=True)
+def apply_palette(values, max_iter, lut, image):
+    height, width = values.shape[0], values.shape[1]
+    colors = lut.shape[0]
+
+    for y in prange(height):
+        for x in range(width):
+            value = values[y, x]
+            if value < 0:
+                image[y, x, 0] = 0
+                image[y, x, 1] = 0
+                image[y, x, 2] = 0
+            else:
+                index = min(int((colors - 1) * value / max_iter), colors - 1)
+                image[y, x, 0] = lut[index, 0]
+                image[y, x, 1] = lut[index, 1]
+                image[y, x, 2] = lut[index, 2]
+
+def colorize(values, max_iter, palette=HUE_PALETTE, out=None):
+    # Map smooth iteration counts to RGB; no escape-time math runs here, so a
+    # palette change only costs this pass
+    height, width = values.shape
+    image = image_buffer(width, height, out)
+    lut = palette_gradient(tuple(tuple(color) for color in palette))
+    apply_palette(values, int(max_iter), lut, image)
     return image
 
-def julia(width, height, zoom, max_iter, c_complex, center=(0, 0)):
-    image_array = compute_julia(width, height, zoom, max_iter, c_complex, center)
-    img = Image.fromarray(image_array, 'HSV').convert('RGB')
-    return img
+def mandelbrot(width, height, zoom, max_iter, center=(0, 0), palette=HUE_PALETTE, out=None):
+    # RGB render in one call
+    return colorize(mandelbrot_values(width, height, zoom, max_iter, center), max_iter, palette, out)
+
+def julia(width, height, zoom, max_iter, c_complex, center=(0, 0), palette=HUE_PALETTE, out=None):
+    return colorize(julia_values(width, height, zoom, max_iter, c_complex, center), max_iter, palette, out)
+
+def warm_up():
+    # Compile the kernels for their signatures, or load them from the cache
+    compute_mandelbrot.compile(MANDELBROT_SIGNATURE)
+    compute_julia.compile(JULIA_SIGNATURE)
+    apply_palette.compile(PALETTE_SIGNATURE)
+
+def start_warm_up():
+    # Warm up on a background thread and return it. A render that starts
+    # meanwhile blocks on numba's compiler lock, so main.py holds its first
+    # frame back until the thread is done. The parallel threading layer is
+    # started here first (get_num_threads launches it): if a background
+    # thread starts it, the process hangs on exit.
+    get_num_threads()
+    thread = threading.Thread(target=warm_up, daemon=True)
+    thread.start()
+    return thread
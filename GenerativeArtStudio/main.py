@@ -1,7 +1,7 @@
 # main.py
 
 import pygame
-from fractals import mandelbrot, julia
+from fractals import mandelbrot_values, julia_values, colorize, start_warm_up
 from particles import ParticleSystem
 from color_harmony import generate_palette
 from utils import ensure_output_dir, get_timestamp
@@ -11,7 +11,13 @@ import sys
 from threading import Thread
 from PyQt5.QtWidgets import QApplication
 
+# Milliseconds without a VIDEORESIZE event before rendering at the new size
+RESIZE_SETTLE_MS = 250
+
 def main():
+    # Compile (or load cached) fractal kernels while the windows come up
+    warm_up = start_warm_up()
+
     # Initialize Pygame and PyQt5
     pygame.init()
     app = QApplication(sys.argv)
@@ -25,7 +31,14 @@ def main():
     # Initial Settings
     settings = control_panel.get_settings()
     palette = generate_palette(settings['harmony'])
-    fractal_surface = generate_fractal_surface(settings)
+    render_size = (screen_width, screen_height)
+    # Blank until the event thread renders the first frame, once the kernels
+    # are ready; the windows stay responsive meanwhile
+    fractal_surface = pygame.Surface(render_size)
+
+    # While the window is being resized the last render is stretched to fit
+    scaled_surface = scaled_from = None
+    resize_time = 0
 
     # Particle System
     particle_system = ParticleSystem(num_particles=200, bounds=(screen_width, screen_height))
@@ -42,10 +55,23 @@ def main():
         while running:
             app.processEvents()
             new_settings = control_panel.get_settings()
-            if new_settings != settings:
+            if warm_up.is_alive():
+                pass  # Kernels still compiling
+            elif fractal_values[0] is None:
+                settings = new_settings
+                palette = generate_palette(settings['harmony'])
+                fractal_surface = generate_fractal_surface(settings, render_size, palette)
+            elif new_settings != settings:
+                rerender = any(new_settings[key] != settings[key] for key in new_settings if key != 'harmony')
                 settings = new_settings
                 palette = generate_palette(settings['harmony'])
-                fractal_surface = generate_fractal_surface(settings)
+                if rerender:
+                    fractal_surface = generate_fractal_surface(settings, render_size, palette)
+                else:
+                    # Only the harmony changed: recolor the last render
+                    fractal_surface = color_fractal_surface(settings, palette)
+            elif fractal_surface.get_size() != render_size:
+                fractal_surface = generate_fractal_surface(settings, render_size, palette)
             pygame.time.wait(10)
 
     event_thread = Thread(target=process_events)
@@ -64,12 +90,25 @@ def main():
                 screen_width, screen_height = event.size
                 screen = pygame.display.set_mode((screen_width, screen_height), pygame.RESIZABLE)
                 particle_system.bounds = (screen_width, screen_height)
+                resize_time = pygame.time.get_ticks()
+
+        # Render at the new size once resizing has settled
+        if (render_size != (screen_width, screen_height) and
+                pygame.time.get_ticks() - resize_time >= RESIZE_SETTLE_MS):
+            render_size = (screen_width, screen_height)
 
         # Update Particle System
         particle_system.update()
 
-        # Draw Fractal Background
-        screen.blit(fractal_surface, (0, 0))
+        # Draw Fractal Background, stretched while it doesn't match the window
+        window_size = (screen_width, screen_height)
+        if fractal_surface.get_size() == window_size:
+            screen.blit(fractal_surface, (0, 0))
+        else:
+            if scaled_from is not fractal_surface or scaled_surface.get_size() != window_size:
+                scaled_surface = pygame.transform.scale(fractal_surface, window_size)
+                scaled_from = fractal_surface
+            screen.blit(scaled_surface, (0, 0))
 
         # Draw Particles
         particle_system.draw(screen)
@@ -99,19 +138,36 @@ def main():
     pygame.quit()
     sys.exit()
 
-def generate_fractal_surface(settings):
-    fractal_width, fractal_height = 800, 600
+# The palette writes RGB into one of these while the surface wrapping the
+# other one is on screen; they swap after every render. Their memory is
+# reused across window sizes.
+fractal_buffers = [None, None]
+# Smooth iteration counts of the last render, kept so that a new palette
+# only recolors them instead of running the escape-time kernel again
+fractal_values = [None]
+
+def generate_fractal_surface(settings, size, palette):
+    fractal_width, fractal_height = size
     zoom = settings['zoom']
     max_iter = settings['max_iter']
     fractal_type = settings['fractal_type']
 
     if fractal_type == 'Julia':
         c_complex = complex(-0.7, 0.27015)
-        fractal_img = julia(fractal_width, fractal_height, zoom, max_iter, c_complex)
+        fractal_values[0] = julia_values(fractal_width, fractal_height, zoom, max_iter, c_complex,
+                                         out=fractal_values[0])
     else:
-        fractal_img = mandelbrot(fractal_width, fractal_height, zoom, max_iter)
+        fractal_values[0] = mandelbrot_values(fractal_width, fractal_height, zoom, max_iter, out=fractal_values[0])
+    return color_fractal_surface(settings, palette)
+
+def color_fractal_surface(settings, palette):
+    values = fractal_values[0]
+    fractal_height, fractal_width = values.shape
+    fractal_pixels = colorize(values, settings['max_iter'], palette, out=fractal_buffers[0])
+    fractal_buffers[:] = [fractal_buffers[1], fractal_pixels]
 
-    fractal_surface = pygame.image.fromstring(fractal_img.tobytes(), fractal_img.size, fractal_img.mode)
+    # The surface shares the buffer's memory instead of copying it
+    fractal_surface = pygame.image.frombuffer(fractal_pixels, (fractal_width, fractal_height), 'RGB')
     return fractal_surface
 
 def create_animation(frames, width, height, output_dir, timestamp):
@@ -0,0 +1,88 @@
+import os
+
+# The studio module only needs pygame surfaces, never a real window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+import pytest
+
+import GenerateArtStudio as gas
+
+# (x_min, x_max, y_min, y_max) viewports: the full set, the seahorse valley
+# boundary and a view mostly inside the main cardioid
+VIEWPORTS = [
+    (-2.0, 1.0, -1.2, 1.2),
+    (-0.76, -0.73, 0.09, 0.12),
+    (-0.4, 0.2, -0.3, 0.3),
+]
+JULIA_C = complex(-0.7, 0.27015)
+
+@pytest.mark.parametrize("bounds", VIEWPORTS)
+@pytest.mark.parametrize("max_iterations", [50, 200])
+def test_mandelbrot_numpy_matches_python(bounds, max_iterations):
+    h, w = 24, 32
+    expected = gas.compute_mandelbrot(h, w, max_iterations, *bounds)
+    assert np.array_equal(gas.compute_mandelbrot_numpy(h, w, max_iterations, *bounds), expected)
+
+@pytest.mark.parametrize("bounds", VIEWPORTS)
+@pytest.mark.parametrize("max_iterations", [50, 200])
+def test_julia_numpy_matches_python(bounds, max_iterations):
+    h, w = 24, 32
+    expected = gas.compute_julia(h, w, max_iterations, *bounds, JULIA_C)
+    assert np.array_equal(gas.compute_julia_numpy(h, w, max_iterations, *bounds, JULIA_C), expected)
+
+def test_auto_precision_matches_python_at_slider_iterations():
+    generator = gas.FractalGenerator()
+    h, w = 48, 64
+    for max_iterations in (50, 100, 500):
+        generator.max_iterations = max_iterations
+        assert generator.select_precision(gas.WIDTH) == "float64"
+        expected = gas.compute_mandelbrot(h, w, max_iterations, *generator.get_bounds(w, h))
+        assert np.array_equal(generator.compute(w, h), expected)
+
+def finish_render(app):
+    app.render_worker.wait()
+    app.poll_render()
+
+def test_iteration_slider_resumes_unfinished_pixels(monkeypatch):
+    app = gas.GenerativeArtStudio()
+    finish_render(app)
+    state = app.fractal_gen.iteration_state
+    assert state is not None
+    unfinished = state["active"].size
+    
+    # Raising the limit from the UI may only iterate the unfinished pixels
+    orbits = []
+    escape_time = gas.escape_time
+    def recording_escape_time(z, *args, **kwargs):
+        orbits.append(np.asarray(z).size)
+        return escape_time(z, *args, **kwargs)
+    monkeypatch.setattr(gas, "escape_time", recording_escape_time)
+    
+    app.iter_slider.value = app.fractal_gen.max_iterations + 100
+    app.regenerate_art()
+    finish_render(app)
+    assert orbits == [unfinished]
+    
+    fresh = gas.FractalGenerator()
+    fresh.max_iterations = app.fractal_gen.max_iterations
+    monkeypatch.setattr(gas, "escape_time", escape_time)
+    assert np.array_equal(app.fractal_gen.last_fractal, fresh.compute(gas.WIDTH, gas.HEIGHT))
+
+def test_zoom_frame_survives_background_render():
+    app = gas.GenerativeArtStudio()  # Starts a background render
+    app.stop_render_worker()
+    app.fractal_gen.generate_zoom_frame(gas.WIDTH, gas.HEIGHT)
+    source = app.fractal_gen.zoom_source
+    app.render_worker.wait()
+    app.poll_render()
+    assert app.fractal_gen.zoom_source is source
+    assert app.fractal_gen.last_fractal is source["fractal"]
+
+def test_cached_tiles_own_their_memory():
+    cache = gas.FractalTileCache()
+    gas.compute_fractal_cached("mandelbrot", 100, 150, 50, -0.5, 0.0, 2.5, JULIA_C, cache)
+    assert len(cache.tiles) > 1
+    for tile in cache.tiles.values():
+        assert tile.base is None